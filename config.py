@@ -2,144 +2,238 @@
 Configuration management for template generation.
 """
 
-from typing import Dict, Any
+from heapq import merge
+from typing import Dict, Any, NamedTuple, Optional, Tuple, Union
+
+
+_EMPTY: Tuple[str, ...] = ()
+
+
+def _sorted_table(table: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, ...]]:
+    """Sort each package tuple of a table, as Config._build_dependencies requires."""
+    return {choice: tuple(sorted(packages)) for choice, packages in table.items()}
+
+
+class Preferences(NamedTuple):
+    """Typed, immutable view of the preferences that drive dependencies.
+    
+    Field defaults mirror the defaults used when reading the raw preferences
+    dict, so ``Preferences.from_dict(d).x`` equals ``d.get('x', default)``.
+    """
+    
+    state_management: str = 'provider'
+    database: str = 'none'
+    has_auth: bool = False
+    auth_provider: Optional[str] = None
+    has_routing: bool = True
+    has_localization: bool = False
+    has_analytics: bool = False
+    has_crash_reporting: bool = False
+    has_notifications: bool = False
+    has_payments: bool = False
+    app_category: Optional[str] = None
+    game_engine: str = 'flame'
+    has_multiplayer: bool = False
+    multiplayer_type: Optional[str] = None
+    p2p_library: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, preferences: Dict[str, Any]) -> 'Preferences':
+        """Build a record from a preferences dict, ignoring unrelated keys."""
+        return cls(**{key: preferences[key] for key in cls._fields if key in preferences})
 
 
 class Config:
     """Manages configuration for template generation."""
     
+    # Package tables map each choice to a tuple of package names, sorted by
+    # _sorted_table() so dependency lists can be assembled with a linear merge.
+    
     # State management packages
-    STATE_MANAGEMENT_PACKAGES = {
-        'provider': ['provider'],
-        'riverpod': ['flutter_riverpod', 'riverpod_annotation'],
-        'bloc': ['flutter_bloc', 'equatable'],
-        'getx': ['get'],
-        'redux': ['redux', 'flutter_redux'],
-    }
+    STATE_MANAGEMENT_PACKAGES = _sorted_table({
+        'provider': ('provider',),
+        'riverpod': ('flutter_riverpod', 'riverpod_annotation'),
+        'bloc': ('equatable', 'flutter_bloc'),
+        'getx': ('get',),
+        'redux': ('flutter_redux', 'redux'),
+    })
     
     # Database packages
-    DATABASE_PACKAGES = {
-        'firebase_firestore': ['cloud_firestore'],
-        'sqlite': ['sqflite', 'path'],
-        'rest_api_(no_local_db)': ['http', 'dio'],
-        'none': [],
-    }
+    DATABASE_PACKAGES = _sorted_table({
+        'firebase_firestore': ('cloud_firestore',),
+        'sqlite': ('path', 'sqflite'),
+        'rest_api_(no_local_db)': ('dio', 'http'),
+        'none': (),
+    })
     
     # Auth packages
-    AUTH_PACKAGES = {
-        'firebase_auth': ['firebase_auth', 'firebase_core'],
-        'custom_auth_(rest_api)': ['http', 'dio', 'shared_preferences'],
-        'local_auth_(biometric)': ['local_auth'],
-    }
+    AUTH_PACKAGES = _sorted_table({
+        'firebase_auth': ('firebase_auth', 'firebase_core'),
+        'custom_auth_(rest_api)': ('dio', 'http', 'shared_preferences'),
+        'local_auth_(biometric)': ('local_auth',),
+    })
     
     # Routing packages
-    ROUTING_PACKAGES = {
-        'go_router': ['go_router'],
-        'auto_route': ['auto_route', 'auto_route_generator'],
-    }
+    ROUTING_PACKAGES = _sorted_table({
+        'go_router': ('go_router',),
+        'auto_route': ('auto_route', 'auto_route_generator'),
+    })
     
     # Additional feature packages
-    FEATURE_PACKAGES = {
-        'localization': ['flutter_localizations', 'intl'],
-        'analytics': ['firebase_analytics'],
-        'crash_reporting': ['firebase_crashlytics'],
-        'notifications': ['firebase_messaging'],
-        'payments': ['in_app_purchase'],
-    }
+    FEATURE_PACKAGES = _sorted_table({
+        'localization': ('flutter_localizations', 'intl'),
+        'analytics': ('firebase_analytics',),
+        'crash_reporting': ('firebase_crashlytics',),
+        'notifications': ('firebase_messaging',),
+        'payments': ('in_app_purchase',),
+    })
     
     # P2P/Multiplayer packages
-    P2P_PACKAGES = {
-        'flutter_nearby_connections': ['flutter_nearby_connections'],
-        'peerdart': ['peerdart'],
-        'enet_dart': ['enet'],
+    P2P_PACKAGES = _sorted_table({
+        'flutter_nearby_connections': ('flutter_nearby_connections',),
+        'peerdart': ('peerdart',),
+        'enet_dart': ('enet',),
+    })
+    
+    # Common utilities included in every project
+    _BASE_DEPS = tuple(sorted(('path_provider', 'shared_preferences')))
+    
+    # Dev dependencies included in every project
+    _BASE_DEV_DEPS = frozenset({'flutter_test', 'flutter_lints'})
+    
+    # Pre-sorted dev dependencies per state management solution
+    _DEFAULT_DEV_DEPS = tuple(sorted(_BASE_DEV_DEPS))
+    _DEV_DEP_TABLE = {
+        'provider': _DEFAULT_DEV_DEPS,
+        'riverpod': tuple(sorted(_BASE_DEV_DEPS | {'riverpod_generator', 'build_runner'})),
+        'bloc': tuple(sorted(_BASE_DEV_DEPS | {'bloc_test'})),
     }
     
+    # Preference flag -> FEATURE_PACKAGES key
+    _FEATURE_FLAGS = (
+        ('has_localization', 'localization'),
+        ('has_analytics', 'analytics'),
+        ('has_crash_reporting', 'crash_reporting'),
+        ('has_notifications', 'notifications'),
+        ('has_payments', 'payments'),
+    )
+    
+    # Built dependency lists keyed by Config._dependency_key()
+    _DEPS_CACHE: Dict[tuple, tuple] = {}
+    
     @staticmethod
-    def get_dependencies(preferences: Dict[str, Any]) -> list:
-        """Get list of dependencies based on preferences."""
-        dependencies = []
+    def _dependency_key(prefs: Preferences) -> tuple:
+        """Build a fixed-order cache key from the choices that affect dependencies.
+        
+        Choices that cannot influence the result (e.g. auth provider when auth
+        is disabled, game options for non-game apps) are collapsed to None so
+        equivalent preferences share a cache entry.
+        """
+        is_game = prefs.app_category == 'game'
+        has_multiplayer = is_game and bool(prefs.has_multiplayer)
+        multiplayer_type = prefs.multiplayer_type if has_multiplayer else None
+        return (
+            prefs.state_management,
+            prefs.database,
+            prefs.auth_provider if prefs.has_auth else None,
+            bool(prefs.has_routing),
+            bool(prefs.has_localization),
+            bool(prefs.has_analytics),
+            bool(prefs.has_crash_reporting),
+            bool(prefs.has_notifications),
+            bool(prefs.has_payments),
+            is_game,
+            prefs.game_engine.lower() if is_game else None,
+            multiplayer_type,
+            prefs.p2p_library if multiplayer_type == 'p2p' else None,
+        )
+    
+    @staticmethod
+    def get_dependencies(preferences: Union[Dict[str, Any], Preferences]) -> Tuple[str, ...]:
+        """Get sorted dependencies based on preferences.
+        
+        The returned tuple is shared between calls with equivalent preferences.
+        """
+        if not isinstance(preferences, Preferences):
+            preferences = Preferences.from_dict(preferences)
+        key = Config._dependency_key(preferences)
+        cached = Config._DEPS_CACHE.get(key)
+        if cached is None:
+            cached = tuple(Config._build_dependencies(preferences))
+            Config._DEPS_CACHE[key] = cached
+        return cached
+    
+    @staticmethod
+    def get_dependencies_list(preferences: Union[Dict[str, Any], Preferences]) -> list:
+        """Get dependencies as a new, mutable list."""
+        return list(Config.get_dependencies(preferences))
+    
+    @staticmethod
+    def get_dev_dependencies(preferences: Union[Dict[str, Any], Preferences]) -> Tuple[str, ...]:
+        """Get sorted dev dependencies based on preferences."""
+        if isinstance(preferences, Preferences):
+            state_mgmt = preferences.state_management
+        else:
+            state_mgmt = preferences.get('state_management', 'provider')
+        return Config._DEV_DEP_TABLE.get(state_mgmt, Config._DEFAULT_DEV_DEPS)
+    
+    @staticmethod
+    def get_dev_dependencies_list(preferences: Union[Dict[str, Any], Preferences]) -> list:
+        """Get dev dependencies as a new, mutable list."""
+        return list(Config.get_dev_dependencies(preferences))
+    
+    @staticmethod
+    def _build_dependencies(prefs: Preferences) -> list:
+        """Build list of dependencies based on preferences."""
+        selected = [Config._BASE_DEPS]
         
         # State management
-        state_mgmt = preferences.get('state_management', 'provider')
-        dependencies.extend(Config.STATE_MANAGEMENT_PACKAGES.get(state_mgmt, []))
+        selected.append(Config.STATE_MANAGEMENT_PACKAGES.get(prefs.state_management, _EMPTY))
         
         # Database
-        database = preferences.get('database', 'none')
-        dependencies.extend(Config.DATABASE_PACKAGES.get(database, []))
+        selected.append(Config.DATABASE_PACKAGES.get(prefs.database, _EMPTY))
         
         # Auth
-        if preferences.get('has_auth', False):
-            auth_provider = preferences.get('auth_provider')
-            if auth_provider:
-                dependencies.extend(Config.AUTH_PACKAGES.get(auth_provider, []))
+        if prefs.has_auth and prefs.auth_provider:
+            selected.append(Config.AUTH_PACKAGES.get(prefs.auth_provider, _EMPTY))
         
         # Routing
-        if preferences.get('has_routing', True):
-            dependencies.append('go_router')
-        
-        # Localization
-        if preferences.get('has_localization', False):
-            dependencies.extend(Config.FEATURE_PACKAGES['localization'])
-        
-        # Analytics
-        if preferences.get('has_analytics', False):
-            dependencies.extend(Config.FEATURE_PACKAGES['analytics'])
+        if prefs.has_routing:
+            selected.append(Config.ROUTING_PACKAGES['go_router'])
         
-        # Crash reporting
-        if preferences.get('has_crash_reporting', False):
-            dependencies.extend(Config.FEATURE_PACKAGES['crash_reporting'])
-        
-        # Notifications
-        if preferences.get('has_notifications', False):
-            dependencies.extend(Config.FEATURE_PACKAGES['notifications'])
-        
-        # Payments
-        if preferences.get('has_payments', False):
-            dependencies.extend(Config.FEATURE_PACKAGES['payments'])
+        # Additional features
+        for flag, packages in Config._RESOLVED_FEATURES:
+            if getattr(prefs, flag):
+                selected.append(packages)
         
         # Game-specific
-        if preferences.get('app_category') == 'game':
-            game_engine = preferences.get('game_engine', 'flame')
-            if game_engine.lower() == 'flame':
-                dependencies.append('flame')
-            
-            # P2P/Multiplayer
-            if preferences.get('has_multiplayer', False):
-                multiplayer_type = preferences.get('multiplayer_type')
-                if multiplayer_type == 'p2p':
-                    p2p_library = preferences.get('p2p_library')
-                    if p2p_library:
-                        dependencies.extend(Config.P2P_PACKAGES.get(p2p_library, []))
-        
-        # Common utilities
-        dependencies.extend([
-            'shared_preferences',
-            'path_provider',
-        ])
+        if prefs.app_category == 'game':
+            selected.extend(Config._game_deps(prefs))
         
-        # Remove duplicates and sort
-        return sorted(list(set(dependencies)))
+        # Every tuple is sorted, so a k-way merge yields sorted output with
+        # duplicates adjacent to each other
+        dependencies = []
+        for package in merge(*selected):
+            if not dependencies or dependencies[-1] != package:
+                dependencies.append(package)
+        return dependencies
     
     @staticmethod
-    def get_dev_dependencies(preferences: Dict[str, Any]) -> list:
-        """Get list of dev dependencies based on preferences."""
-        dev_dependencies = [
-            'flutter_test',
-            'flutter_lints',
-        ]
+    def _game_deps(prefs: Preferences) -> list:
+        """Resolve game engine and P2P multiplayer package tuples."""
+        selected = []
         
-        # State management dev dependencies
-        state_mgmt = preferences.get('state_management', 'provider')
-        if state_mgmt == 'riverpod':
-            dev_dependencies.append('riverpod_generator')
-            dev_dependencies.append('build_runner')
-        elif state_mgmt == 'bloc':
-            dev_dependencies.append('bloc_test')
+        if prefs.game_engine.lower() == 'flame':
+            selected.append(('flame',))
         
-        # Routing dev dependencies
-        if preferences.get('has_routing', True):
-            # go_router doesn't need dev dependencies
-            pass
+        # P2P/Multiplayer
+        if prefs.has_multiplayer and prefs.multiplayer_type == 'p2p' and prefs.p2p_library:
+            selected.append(Config.P2P_PACKAGES.get(prefs.p2p_library, _EMPTY))
         
-        return sorted(list(set(dev_dependencies)))
+        return selected
+
 
+# Feature flags paired with their package sets, resolved once at import
+Config._RESOLVED_FEATURES = tuple(
+    (flag, Config.FEATURE_PACKAGES[feature]) for flag, feature in Config._FEATURE_FLAGS
+)
@@ -2,616 +2,74 @@
 Flutter template generator.
 """
 
+import hashlib
+import io
 import os
+import re
 import subprocess
+import sys
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from string import Template
+from typing import Callable, Dict, Any, List, Tuple, Union
 from config import Config
 
 
-class FlutterTemplateGenerator:
-    """Generates Flutter app templates based on preferences."""
-    
-    def __init__(self, preferences: Dict[str, Any], project_name: str, output_path: Path):
-        self.preferences = preferences
-        self.project_name = project_name
-        self.output_path = Path(output_path)
-        self.app_category = preferences.get('app_category', 'transactional app')
-    
-    def generate(self):
-        """Generate the complete Flutter template."""
-        import subprocess
-        
-        # Create directory structure
-        self._create_directory_structure()
-        
-        # Generate pubspec.yaml
-        self._generate_pubspec()
-        
-        # Generate main.dart
-        self._generate_main_dart()
-        
-        # Generate app structure
-        self._generate_app_structure()
-        
-        # Generate configuration files
-        self._generate_config_files()
-        
-        # Generate README
-        self._generate_readme()
-        
-        # Create platform folders based on user selection
-        selected_platforms = self.preferences.get('platforms', ['android', 'ios'])
-        if selected_platforms:
-            platforms_str = ','.join(selected_platforms)
-            print(f"  Creating platform folders ({platforms_str})...")
-            try:
-                # Run flutter create to generate platform folders
-                # Use --project-name to match our project name
-                project_name = self.project_name.lower().replace(' ', '_')
-                # Build the command with selected platforms
-                cmd = ['flutter', 'create', '--project-name', project_name, f'--platforms={platforms_str}', '.']
-                result = subprocess.run(
-                    cmd,
-                    cwd=self.output_path,
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                if result.returncode != 0:
-                    # If that fails, try without project name (in case it conflicts)
-                    subprocess.run(
-                        ['flutter', 'create', f'--platforms={platforms_str}', '.'],
-                        cwd=self.output_path,
-                        capture_output=True,
-                        text=True,
-                        check=False
-                    )
-            except FileNotFoundError:
-                print("  ⚠️  Warning: Flutter not found in PATH. Platform folders not created.")
-                print(f"     Run 'flutter create --platforms={platforms_str} .' manually in the project directory.")
-            except Exception as e:
-                print(f"  ⚠️  Warning: Could not create platform folders: {e}")
-                print(f"     Run 'flutter create --platforms={platforms_str} .' manually in the project directory.")
-            
-            # Configure orientation after platform folders are created
-            self._configure_orientation()
-            
-            # Configure iOS deployment target (especially for Firebase)
-            self._configure_ios_deployment_target()
-            
-            # Configure Android SDK versions
-            self._configure_android_sdk()
+# SDK packages that need 'sdk: flutter'
+_SDK_PACKAGES = frozenset({'flutter_localizations'})
+_SDK_DEV_PACKAGES = frozenset({'flutter_test'})
+
+
+def _dependency_block(packages, sdk_packages) -> str:
+    """Render pubspec entries with SDK packages first, in a single pass."""
+    sdk, regular = io.StringIO(), io.StringIO()
+    for dep in packages:
+        if dep in sdk_packages:
+            sdk.write(f"  {dep}:\n    sdk: flutter\n")
         else:
-            print("  ⚠️  No platforms selected. Skipping platform folder creation.")
-    
-    def _configure_orientation(self):
-        """Configure screen orientation for Android and iOS."""
-        orientation = self.preferences.get('orientation', 'both')
-        
-        if orientation == 'both':
-            return  # No need to lock orientation
-        
-        print(f"  Configuring orientation: {orientation}")
-        
-        # Configure Android
-        android_manifest = self.output_path / 'android' / 'app' / 'src' / 'main' / 'AndroidManifest.xml'
-        if android_manifest.exists():
-            try:
-                content = android_manifest.read_text()
-                # Find the activity tag and add screenOrientation
-                import re
-                # Map orientation to Android values
-                android_orientation = 'portrait' if orientation == 'portrait' else 'landscape'
-                
-                # Check if screenOrientation already exists
-                if 'android:screenOrientation' not in content:
-                    # Add screenOrientation to the main activity
-                    content = re.sub(
-                        r'(<activity[^>]*android:name="[^"]*MainActivity"[^>]*)>',
-                        rf'\1 android:screenOrientation="{android_orientation}">',
-                        content
-                    )
-                    android_manifest.write_text(content)
-                    print(f"    ✓ Android configured for {orientation} mode")
-            except Exception as e:
-                print(f"    ⚠️  Could not configure Android orientation: {e}")
-        
-        # Configure iOS - this is done via Info.plist
-        ios_info_plist = self.output_path / 'ios' / 'Runner' / 'Info.plist'
-        if ios_info_plist.exists():
-            try:
-                content = ios_info_plist.read_text()
-                # Map orientation to iOS values
-                if orientation == 'portrait':
-                    # Only allow portrait orientations
-                    portrait_config = """    <key>UISupportedInterfaceOrientations</key>
-    <array>
-        <string>UIInterfaceOrientationPortrait</string>
-        <string>UIInterfaceOrientationPortraitUpsideDown</string>
-    </array>
-    <key>UISupportedInterfaceOrientations~ipad</key>
-    <array>
-        <string>UIInterfaceOrientationPortrait</string>
-        <string>UIInterfaceOrientationPortraitUpsideDown</string>
-    </array>"""
-                else:  # landscape
-                    # Only allow landscape orientations
-                    portrait_config = """    <key>UISupportedInterfaceOrientations</key>
-    <array>
-        <string>UIInterfaceOrientationLandscapeLeft</string>
-        <string>UIInterfaceOrientationLandscapeRight</string>
-    </array>
-    <key>UISupportedInterfaceOrientations~ipad</key>
-    <array>
-        <string>UIInterfaceOrientationLandscapeLeft</string>
-        <string>UIInterfaceOrientationLandscapeRight</string>
-    </array>"""
-                
-                # Check if orientation keys already exist
-                if 'UISupportedInterfaceOrientations' not in content:
-                    # Add before closing </dict> tag
-                    content = content.replace('</dict>', f'{portrait_config}\n</dict>')
-                    ios_info_plist.write_text(content)
-                    print(f"    ✓ iOS configured for {orientation} mode")
-            except Exception as e:
-                print(f"    ⚠️  Could not configure iOS orientation: {e}")
-        
-        # Also add programmatic orientation lock in main.dart
-        self._add_orientation_lock_to_main()
-    
-    def _add_orientation_lock_to_main(self):
-        """Add orientation locking code to main.dart."""
-        orientation = self.preferences.get('orientation', 'both')
-        if orientation == 'both':
-            return
-        
-        main_dart_path = self.output_path / 'lib' / 'main.dart'
-        if not main_dart_path.exists():
-            return
-        
-        try:
-            content = main_dart_path.read_text()
-            
-            # Check if SystemChrome.setPreferredOrientations is already there
-            if 'SystemChrome.setPreferredOrientations' in content:
-                return
-            
-            # Import SystemChrome if not already imported
-            if 'import \'package:flutter/services.dart\';' not in content:
-                # Add import after other imports
-                import re
-                content = re.sub(
-                    r"(import 'package:flutter/material.dart';)",
-                    r"\1\nimport 'package:flutter/services.dart';",
-                    content
-                )
-            
-            # Map orientation to DeviceOrientation values
-            if orientation == 'portrait':
-                orientations = "[DeviceOrientation.portraitUp, DeviceOrientation.portraitDown]"
-            else:  # landscape
-                orientations = "[DeviceOrientation.landscapeLeft, DeviceOrientation.landscapeRight]"
-            
-            # Add SystemChrome configuration in main() function
-            orientation_code = f"""
-  // Lock orientation to {orientation}
-  await SystemChrome.setPreferredOrientations({orientations});
-"""
-            
-            # Add after runApp or at the start of main
-            if 'void main()' in content:
-                # Find the main function and add orientation lock
-                import re
-                # Add after runApp call or at the end of main function
-                if 'runApp(' in content:
-                    # Add before runApp
-                    content = re.sub(
-                        r'(void main\(\)[^{]*\{)',
-                        rf'\1{orientation_code}',
-                        content,
-                        count=1
-                    )
-                else:
-                    # Add at the start of main function
-                    content = re.sub(
-                        r'(void main\(\)[^{]*\{)',
-                        rf'\1{orientation_code}',
-                        content,
-                        count=1
-                    )
-                
-                # Make main async if needed
-                if 'Future<void> main()' not in content and 'await' in orientation_code:
-                    content = content.replace('void main()', 'Future<void> main()', 1)
-            
-            main_dart_path.write_text(content)
-            print(f"    ✓ Added programmatic orientation lock to main.dart")
-        except Exception as e:
-            print(f"    ⚠️  Could not add orientation lock to main.dart: {e}")
-    
-    def _configure_ios_deployment_target(self):
-        """Configure iOS deployment target, using latest versions."""
-        # Check if Firebase packages are being used
-        dependencies = Config.get_dependencies(self.preferences)
-        has_firebase = any('firebase' in dep.lower() for dep in dependencies)
-        
-        # Use latest iOS version (17.0 is latest stable, Firebase requires 15.0 minimum)
-        # Using 17.0 for latest features and compatibility
-        min_ios_version = '17.0'
-        
-        if 'ios' not in self.preferences.get('platforms', []):
-            return
-        
-        print(f"  Configuring iOS deployment target: {min_ios_version}")
-        
-        # Update Podfile
-        podfile_path = self.output_path / 'ios' / 'Podfile'
-        if podfile_path.exists():
-            try:
-                content = podfile_path.read_text()
-                import re
-                
-                # Update platform line if it exists
-                if re.search(r"platform :ios, ['\"][\d.]+['\"]", content):
-                    content = re.sub(
-                        r"platform :ios, ['\"][\d.]+['\"]",
-                        f"platform :ios, '{min_ios_version}'",
-                        content
-                    )
-                else:
-                    # Add platform line if it doesn't exist (shouldn't happen, but just in case)
-                    if 'platform :ios' not in content:
-                        content = f"platform :ios, '{min_ios_version}'\n" + content
-                
-                podfile_path.write_text(content)
-                print(f"    ✓ Updated Podfile to iOS {min_ios_version}")
-            except Exception as e:
-                print(f"    ⚠️  Could not update Podfile: {e}")
-        
-        # Update project.pbxproj (Xcode project file)
-        project_pbxproj_path = self.output_path / 'ios' / 'Runner.xcodeproj' / 'project.pbxproj'
-        if not project_pbxproj_path.exists():
-            # Try alternative location
-            project_pbxproj_path = self.output_path / 'ios' / 'Runner' / 'Runner.xcodeproj' / 'project.pbxproj'
-        
-        if project_pbxproj_path.exists():
-            try:
-                content = project_pbxproj_path.read_text()
-                import re
-                
-                # Update IPHONEOS_DEPLOYMENT_TARGET
-                # Find all occurrences and update them
-                pattern = r'IPHONEOS_DEPLOYMENT_TARGET = [\d.]+;'
-                if re.search(pattern, content):
-                    content = re.sub(
-                        pattern,
-                        f'IPHONEOS_DEPLOYMENT_TARGET = {min_ios_version};',
-                        content
-                    )
-                    project_pbxproj_path.write_text(content)
-                    print(f"    ✓ Updated Xcode project to iOS {min_ios_version}")
-                else:
-                    print(f"    ⚠️  Could not find IPHONEOS_DEPLOYMENT_TARGET in project file")
-            except Exception as e:
-                print(f"    ⚠️  Could not update Xcode project file: {e}")
-        
-        if has_firebase:
-            print(f"    ℹ️  iOS {min_ios_version} supports Firebase packages")
-    
-    def _configure_android_sdk(self):
-        """Configure Android SDK versions to use latest."""
-        if 'android' not in self.preferences.get('platforms', []):
-            return
-        
-        print("  Configuring Android SDK versions (latest)...")
-        
-        # Latest Android versions (API 35 = Android 15)
-        min_sdk = 24  # Android 7.0 (Nougat) - reasonable minimum
-        target_sdk = 35  # Android 15 - latest
-        compile_sdk = 35  # Android 15 - latest
-        
-        # Update build.gradle
-        build_gradle_path = self.output_path / 'android' / 'app' / 'build.gradle'
-        if build_gradle_path.exists():
-            try:
-                content = build_gradle_path.read_text()
-                import re
-                
-                # Update minSdkVersion
-                if re.search(r'minSdkVersion\s+\d+', content):
-                    content = re.sub(
-                        r'minSdkVersion\s+\d+',
-                        f'minSdkVersion {min_sdk}',
-                        content
-                    )
-                else:
-                    # Add if doesn't exist in defaultConfig
-                    if 'defaultConfig {' in content:
-                        content = content.replace(
-                            'defaultConfig {',
-                            f'defaultConfig {{\n        minSdkVersion {min_sdk}',
-                            1
-                        )
-                
-                # Update targetSdkVersion
-                if re.search(r'targetSdkVersion\s+\d+', content):
-                    content = re.sub(
-                        r'targetSdkVersion\s+\d+',
-                        f'targetSdkVersion {target_sdk}',
-                        content
-                    )
-                else:
-                    if 'defaultConfig {' in content:
-                        content = content.replace(
-                            'defaultConfig {',
-                            f'defaultConfig {{\n        targetSdkVersion {target_sdk}',
-                            1
-                        )
-                
-                # Update compileSdkVersion
-                if re.search(r'compileSdkVersion\s+\d+', content):
-                    content = re.sub(
-                        r'compileSdkVersion\s+\d+',
-                        f'compileSdkVersion {compile_sdk}',
-                        content
-                    )
-                else:
-                    if 'android {' in content:
-                        content = content.replace(
-                            'android {',
-                            f'android {{\n    compileSdkVersion {compile_sdk}',
-                            1
-                        )
-                
-                build_gradle_path.write_text(content)
-                print(f"    ✓ Updated Android SDK: min={min_sdk}, target={target_sdk}, compile={compile_sdk}")
-            except Exception as e:
-                print(f"    ⚠️  Could not update Android build.gradle: {e}")
-    
-    def _create_directory_structure(self):
-        """Create the Flutter project directory structure."""
-        directories = [
-            'lib',
-            'lib/models',
-            'lib/services',
-            'lib/repositories',
-            'lib/screens',
-            'lib/widgets',
-            'lib/utils',
-            'lib/constants',
-            'test',
-            'assets',
-            'assets/images',
-            'assets/icons',
-        ]
-        
-        # Category-specific directories
-        if self.app_category == 'game':
-            directories.extend([
-                'lib/game',
-                'lib/game/components',
-                'lib/game/systems',
-                'assets/sprites',
-                'assets/sounds',
-            ])
-        else:  # transactional app
-            directories.extend([
-                'lib/features',
-                'lib/providers',
-            ])
-        
-        # Auth directories
-        if self.preferences.get('has_auth', False):
-            directories.extend([
-                'lib/auth',
-                'lib/screens/auth',
-            ])
-        
-        # Create directories
-        for directory in directories:
-            (self.output_path / directory).mkdir(parents=True, exist_ok=True)
-    
-    def _generate_pubspec(self):
-        """Generate pubspec.yaml file."""
-        dependencies = Config.get_dependencies(self.preferences)
-        dev_dependencies = Config.get_dev_dependencies(self.preferences)
-        
-        # SDK packages that need 'sdk: flutter'
-        sdk_packages = ['flutter_localizations']
-        sdk_dev_packages = ['flutter_test']
-        
-        # Separate SDK packages from regular packages
-        sdk_deps = [d for d in dependencies if d in sdk_packages]
-        regular_deps = [d for d in dependencies if d not in sdk_packages]
-        
-        sdk_dev_deps = [d for d in dev_dependencies if d in sdk_dev_packages]
-        regular_dev_deps = [d for d in dev_dependencies if d not in sdk_dev_packages]
-        
-        pubspec_content = f"""name: {self.project_name.lower().replace(' ', '_')}
-description: A Flutter {self.app_category} template.
-publish_to: 'none'
-version: 1.0.0+1
+            regular.write(f"  {dep}:\n")
+    return sdk.getvalue() + regular.getvalue()
 
-environment:
-  sdk: '>=3.5.0 <4.0.0'
 
-dependencies:
-  flutter:
-    sdk: flutter
-"""
-        
-        # Add SDK packages first
-        for dep in sdk_deps:
-            pubspec_content += f"  {dep}:\n    sdk: flutter\n"
-        # Add regular packages (use ^ for latest compatible version)
-        for dep in regular_deps:
-            pubspec_content += f"  {dep}:\n"
-        
-        pubspec_content += "\ndev_dependencies:\n"
-        # Add SDK dev packages first
-        for dep in sdk_dev_deps:
-            pubspec_content += f"  {dep}:\n    sdk: flutter\n"
-        # Add regular dev packages
-        for dep in regular_dev_deps:
-            pubspec_content += f"  {dep}:\n"
-        
-        pubspec_content += """
-flutter:
-  uses-material-design: true
-  
-  assets:
-    - assets/images/
-    - assets/icons/
-"""
-        
-        if self.app_category == 'game':
-            pubspec_content += """    - assets/sprites/
-    - assets/sounds/
-"""
-        
-        (self.output_path / 'pubspec.yaml').write_text(pubspec_content)
+def _version_tuple(version: str) -> tuple:
+    """Turn a dotted version such as '12.0' into a comparable tuple."""
+    return tuple(int(part) for part in version.split('.') if part)
+
+
+def _intern(value):
+    """Intern string preference values so dispatch compares hit identity."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _NameTable(dict):
+    """str.translate table mapping any character outside [a-z0-9_] to '_'."""
     
-    def _generate_main_dart(self):
-        """Generate main.dart file."""
-        state_mgmt = self.preferences.get('state_management', 'provider')
-        has_routing = self.preferences.get('has_routing', True)
-        has_theme = self.preferences.get('has_theme', True)
-        
-        imports = ["import 'package:flutter/material.dart';"]
-        
-        if state_mgmt == 'provider':
-            imports.append("import 'package:provider/provider.dart';")
-        elif state_mgmt == 'riverpod':
-            imports.append("import 'package:flutter_riverpod/flutter_riverpod.dart';")
-        elif state_mgmt == 'bloc':
-            imports.append("import 'package:flutter_bloc/flutter_bloc.dart';")
-        
-        if has_routing:
-            imports.append("import 'package:go_router/go_router.dart';")
-        
-        imports.append("import 'screens/home_screen.dart';")
-        
-        if has_theme:
-            imports.append("import 'utils/theme.dart';")
-        
-        main_content = "\n".join(imports) + "\n\n"
-        
-        if state_mgmt == 'riverpod':
-            main_content += """void main() {
-  runApp(
-    const ProviderScope(
-      child: MyApp(),
-    ),
-  );
-}
+    def __missing__(self, key):
+        return 0x5F  # '_'
 
-class MyApp extends StatelessWidget {
-  const MyApp({super.key});
 
-  @override
-  Widget build(BuildContext context) {
-"""
-        elif state_mgmt == 'provider':
-            main_content += """void main() {
-  runApp(
-    MultiProvider(
-      providers: [
-        // Add your providers here
-      ],
-      child: const MyApp(),
-    ),
-  );
-}
+# Lowercases ASCII letters and replaces everything else Dart rejects in a
+# package name, in a single translate pass
+_NAME_TABLE = _NameTable({ord(c): ord(c) for c in 'abcdefghijklmnopqrstuvwxyz0123456789_'})
+_NAME_TABLE.update({ord(c): ord(c.lower()) for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'})
 
-class MyApp extends StatelessWidget {
-  const MyApp({super.key});
+# Patterns used to patch files created by 'flutter create'
+_RE_MAIN_ACTIVITY = re.compile(r'(<activity[^>]*android:name="[^"]*MainActivity"[^>]*)>')
+_RE_IOS_PLATFORM = re.compile(r"platform :ios, ['\"]([\d.]+)['\"]")
+_RE_IPHONEOS_TARGET = re.compile(r'IPHONEOS_DEPLOYMENT_TARGET = ([\d.]+);')
+_RE_MIN_SDK = re.compile(r'minSdkVersion\s+\d+')
+_RE_TARGET_SDK = re.compile(r'targetSdkVersion\s+\d+')
+_RE_COMPILE_SDK = re.compile(r'compileSdkVersion\s+\d+')
 
-  @override
-  Widget build(BuildContext context) {
-"""
-        else:
-            main_content += """void main() {
-  runApp(const MyApp());
-}
+# Directories 'flutter create' generates on its own
+_FLUTTER_DEFAULT_DIRS = frozenset({'lib', 'test', 'assets'})
 
-class MyApp extends StatelessWidget {
-  const MyApp({super.key});
+# Records the preferences hash of the last successful generation
+_CACHE_FILE = '.template_cache'
 
-  @override
-  Widget build(BuildContext context) {
-"""
-        
-        if has_routing:
-            main_content += f"""    return MaterialApp.router(
-      title: '{self.project_name}',
-      debugShowCheckedModeBanner: false,
-"""
-            if has_theme:
-                main_content += """      theme: AppTheme.lightTheme,
-      darkTheme: AppTheme.darkTheme,
-      themeMode: ThemeMode.system,
-"""
-            main_content += """      routerConfig: _router,
-    );
-  }
-}
+# Static file templates (no per-project substitutions), stored pre-encoded
 
-final GoRouter _router = GoRouter(
-  routes: [
-    GoRoute(
-      path: '/',
-      builder: (context, state) => const HomeScreen(),
-    ),
-    // Add more routes here
-  ],
-);
-"""
-        else:
-            main_content += f"""    return MaterialApp(
-      title: '{self.project_name}',
-      debugShowCheckedModeBanner: false,
-"""
-            if has_theme:
-                main_content += """      theme: AppTheme.lightTheme,
-      darkTheme: AppTheme.darkTheme,
-      themeMode: ThemeMode.system,
-"""
-            main_content += """      home: const HomeScreen(),
-    );
-  }
-}
-"""
-        
-        (self.output_path / 'lib' / 'main.dart').write_text(main_content)
-    
-    def _generate_app_structure(self):
-        """Generate app structure files."""
-        # Home screen
-        self._generate_home_screen()
-        
-        # Theme file
-        if self.preferences.get('has_theme', True):
-            self._generate_theme_file()
-        
-        # Auth files
-        if self.preferences.get('has_auth', False):
-            self._generate_auth_files()
-        
-        # Database files
-        database = self.preferences.get('database', 'none')
-        if database != 'none':
-            self._generate_database_files(database)
-        
-        # Category-specific files
-        if self.app_category == 'game':
-            self._generate_game_files()
-        else:
-            self._generate_transactional_files()
-    
-    def _generate_home_screen(self):
-        """Generate home screen."""
-        content = """import 'package:flutter/material.dart';
+_HOME_SCREEN_DART = b"""import 'package:flutter/material.dart';
 
 class HomeScreen extends StatelessWidget {
   const HomeScreen({super.key});
@@ -642,11 +100,8 @@ class HomeScreen extends StatelessWidget {
   }
 }
 """
-        (self.output_path / 'lib' / 'screens' / 'home_screen.dart').write_text(content)
-    
-    def _generate_theme_file(self):
-        """Generate theme configuration file."""
-        content = """import 'package:flutter/material.dart';
+
+_THEME_DART = b"""import 'package:flutter/material.dart';
 
 class AppTheme {
   static ThemeData get lightTheme {
@@ -675,15 +130,9 @@ class AppTheme {
   }
 }
 """
-        (self.output_path / 'lib' / 'utils' / 'theme.dart').write_text(content)
-    
-    def _generate_auth_files(self):
-        """Generate authentication-related files."""
-        auth_provider = self.preferences.get('auth_provider', 'firebase_auth')
-        
-        # Auth service
-        if 'firebase' in auth_provider:
-            content = """import 'package:firebase_auth/firebase_auth.dart';
+
+_FIREBASE_AUTH_SERVICE_DART = b"""import 'package:firebase_auth/firebase_auth.dart';
+import 'package:flutter/foundation.dart';
 
 class AuthService {
   final FirebaseAuth _auth = FirebaseAuth.instance;
@@ -700,7 +149,7 @@ class AuthService {
         password: password,
       );
     } catch (e) {
-      print('Sign in error: $e');
+      debugPrint('Sign in error: $e');
       return null;
     }
   }
@@ -715,7 +164,7 @@ class AuthService {
         password: password,
       );
     } catch (e) {
-      print('Sign up error: $e');
+      debugPrint('Sign up error: $e');
       return null;
     }
   }
@@ -727,8 +176,8 @@ class AuthService {
   User? get currentUser => _auth.currentUser;
 }
 """
-        else:
-            content = """class AuthService {
+
+_CUSTOM_AUTH_SERVICE_DART = b"""class AuthService {
   // Implement your custom auth logic here
   Future<bool> signIn(String email, String password) async {
     // TODO: Implement authentication
@@ -747,11 +196,8 @@ class AuthService {
   bool get isAuthenticated => false; // TODO: Check auth state
 }
 """
-        
-        (self.output_path / 'lib' / 'auth' / 'auth_service.dart').write_text(content)
-        
-        # Login screen
-        login_screen = """import 'package:flutter/material.dart';
+
+_LOGIN_SCREEN_DART = b"""import 'package:flutter/material.dart';
 import '../auth/auth_service.dart';
 
 class LoginScreen extends StatefulWidget {
@@ -837,12 +283,8 @@ class _LoginScreenState extends State<LoginScreen> {
   }
 }
 """
-        (self.output_path / 'lib' / 'screens' / 'auth' / 'login_screen.dart').write_text(login_screen)
-    
-    def _generate_database_files(self, database: str):
-        """Generate database-related files."""
-        if database == 'sqlite':
-            content = """import 'package:sqflite/sqflite.dart';
+
+_SQLITE_SERVICE_DART = b"""import 'package:sqflite/sqflite.dart';
 import 'package:path/path.dart';
 
 class DatabaseService {
@@ -883,10 +325,8 @@ class DatabaseService {
   }
 }
 """
-            (self.output_path / 'lib' / 'services' / 'database_service.dart').write_text(content)
-        
-        elif database == 'firebase_firestore':
-            content = """import 'package:cloud_firestore/cloud_firestore.dart';
+
+_FIRESTORE_SERVICE_DART = b"""import 'package:cloud_firestore/cloud_firestore.dart';
 
 class FirestoreService {
   final FirebaseFirestore _firestore = FirebaseFirestore.instance;
@@ -916,14 +356,8 @@ class FirestoreService {
   }
 }
 """
-            (self.output_path / 'lib' / 'services' / 'firestore_service.dart').write_text(content)
-    
-    def _generate_game_files(self):
-        """Generate game-specific files."""
-        game_engine = self.preferences.get('game_engine', 'flame')
-        
-        if game_engine.lower() == 'flame':
-            content = """import 'package:flame/game.dart';
+
+_FLAME_GAME_DART = b"""import 'package:flame/game.dart';
 import 'package:flutter/material.dart';
 
 class MyGame extends FlameGame {
@@ -946,18 +380,16 @@ class MyGame extends FlameGame {
   }
 }
 """
-            (self.output_path / 'lib' / 'game' / 'my_game.dart').write_text(content)
-        
-        # Generate P2P multiplayer service if enabled
-        if self.preferences.get('has_multiplayer', False) and self.preferences.get('multiplayer_type') == 'p2p':
-            self._generate_p2p_service()
-    
-    def _generate_p2p_service(self):
-        """Generate P2P multiplayer service."""
-        p2p_library = self.preferences.get('p2p_library', 'flutter_nearby_connections')
-        
-        if p2p_library == 'flutter_nearby_connections':
-            content = """import 'package:flutter_nearby_connections/flutter_nearby_connections.dart';
+
+# Fragments shared by the P2P service templates
+_FOUNDATION_IMPORT = b"import 'package:flutter/foundation.dart';\n"
+_P2P_CALLBACKS = b"""  // Callbacks
+  Function(String)? onConnected;
+  Function(String)? onMessageReceived;
+  Function()? onDisconnected;
+"""
+
+_P2P_NEARBY_DART = _FOUNDATION_IMPORT + b"""import 'package:flutter_nearby_connections/flutter_nearby_connections.dart';
 
 class P2PService {
   final FlutterNearbyConnections _nearbyConnections = FlutterNearbyConnections();
@@ -1006,7 +438,7 @@ class P2PService {
       );
       _isAdvertising = true;
     } catch (e) {
-      print('Error starting advertising: $e');
+      debugPrint('Error starting advertising: $e');
     }
   }
 
@@ -1028,7 +460,7 @@ class P2PService {
       );
       _isDiscovering = true;
     } catch (e) {
-      print('Error starting discovery: $e');
+      debugPrint('Error starting discovery: $e');
     }
   }
 
@@ -1060,14 +492,14 @@ class P2PService {
         },
       );
     } catch (e) {
-      print('Error connecting to device: $e');
+      debugPrint('Error connecting to device: $e');
     }
   }
 
   /// Send message to connected device
   Future<void> sendMessage(String message) async {
     if (_connectedDevice == null) {
-      print('No device connected');
+      debugPrint('No device connected');
       return;
     }
 
@@ -1078,7 +510,7 @@ class P2PService {
         message.codeUnits,
       );
     } catch (e) {
-      print('Error sending message: $e');
+      debugPrint('Error sending message: $e');
     }
   }
 
@@ -1104,19 +536,15 @@ class P2PService {
   bool get isConnected => _connectedDevice != null;
 }
 """
-        elif p2p_library == 'peerdart':
-            content = """import 'package:peerdart/peerdart.dart';
+
+_P2P_PEERDART_DART = _FOUNDATION_IMPORT + b"""import 'package:peerdart/peerdart.dart';
 
 class P2PService {
   Peer? _peer;
   DataConnection? _connection;
   String? _peerId;
 
-  // Callbacks
-  Function(String)? onConnected;
-  Function(String)? onMessageReceived;
-  Function()? onDisconnected;
-
+""" + _P2P_CALLBACKS + b"""
   /// Initialize peer connection
   Future<void> initialize({String? peerId}) async {
     try {
@@ -1124,7 +552,7 @@ class P2PService {
       _peerId = _peer!.id;
       
       _peer!.on('open', (id) {
-        print('Peer ID: $id');
+        debugPrint('Peer ID: $id');
       });
 
       _peer!.on('connection', (conn) {
@@ -1134,10 +562,10 @@ class P2PService {
       });
 
       _peer!.on('error', (error) {
-        print('Peer error: $error');
+        debugPrint('Peer error: $error');
       });
     } catch (e) {
-      print('Error initializing peer: $e');
+      debugPrint('Error initializing peer: $e');
     }
   }
 
@@ -1151,7 +579,7 @@ class P2PService {
       _connection = _peer!.connect(peerId) as DataConnection;
       _setupConnection();
     } catch (e) {
-      print('Error connecting to peer: $e');
+      debugPrint('Error connecting to peer: $e');
     }
   }
 
@@ -1175,7 +603,7 @@ class P2PService {
   /// Send message to connected peer
   void sendMessage(String message) {
     if (_connection == null) {
-      print('No connection established');
+      debugPrint('No connection established');
       return;
     }
 
@@ -1197,9 +625,10 @@ class P2PService {
   bool get isConnected => _connection != null;
 }
 """
-        else:  # enet_dart or default
-            content = """import 'dart:typed_data';
-// Note: ENet implementation may vary. This is a basic structure.
+
+_P2P_ENET_DART = b"""import 'dart:typed_data';
+
+""" + _FOUNDATION_IMPORT + b"""// Note: ENet implementation may vary. This is a basic structure.
 // Refer to the enet package documentation for specific implementation.
 
 class P2PService {
@@ -1210,11 +639,7 @@ class P2PService {
   String? _hostAddress;
   int? _port;
 
-  // Callbacks
-  Function(String)? onConnected;
-  Function(String)? onMessageReceived;
-  Function()? onDisconnected;
-
+""" + _P2P_CALLBACKS + b"""
   /// Start hosting a game
   Future<void> startHost({int port = 7777}) async {
     // TODO: Implement ENet host creation
@@ -1235,7 +660,7 @@ class P2PService {
   /// Send message/data
   Future<void> sendMessage(String message) async {
     if (!_isConnected) {
-      print('Not connected');
+      debugPrint('Not connected');
       return;
     }
     // TODO: Implement ENet message sending
@@ -1254,25 +679,16 @@ class P2PService {
   bool get isConnected => _isConnected;
 }
 """
-        
-        (self.output_path / 'lib' / 'services' / 'p2p_service.dart').write_text(content)
-    
-    def _generate_transactional_files(self):
-        """Generate transactional app-specific files."""
-        # Example: Create a sample feature
-        content = """// Example feature structure for transactional apps
+
+_TRANSACTIONAL_EXAMPLE_DART = b"""// Example feature structure for transactional apps
 // Organize your features in the lib/features directory
 
 class FeatureExample {
   // TODO: Implement your feature logic here
 }
 """
-        (self.output_path / 'lib' / 'features' / 'example_feature.dart').write_text(content)
-    
-    def _generate_config_files(self):
-        """Generate configuration files."""
-        # .gitignore
-        gitignore = """# Miscellaneous
+
+_GITIGNORE = b"""# Miscellaneous
 *.class
 *.log
 *.pyc
@@ -1282,6 +698,7 @@ class FeatureExample {
 .buildlog/
 .history
 .svn/
+.template_cache
 migrate_working_dir/
 
 # IntelliJ related
@@ -1344,44 +761,209 @@ app.*.map.json
 **/ios/ServiceDefinitions.json
 **/ios/Runner/GeneratedPluginRegistrant.*
 
-# Firebase
-**/ios/firebase_app_id_file.json
-**/android/app/google-services.json
-"""
-        (self.output_path / '.gitignore').write_text(gitignore)
-        
-        # Analysis options
-        analysis_options = """include: package:flutter_lints/flutter.yaml
+# Firebase
+**/ios/firebase_app_id_file.json
+**/android/app/google-services.json
+"""
+
+_ANALYSIS_OPTIONS = b"""include: package:flutter_lints/flutter.yaml
+
+linter:
+  rules:
+    - prefer_const_constructors
+    - prefer_const_literals_to_create_immutables
+    - avoid_print
+    - prefer_single_quotes
+    - require_trailing_commas
+
+analyzer:
+  exclude:
+    - "**/*.g.dart"
+    - "**/*.freezed.dart"
+"""
+
+# Template selection tables
+_AUTH_TEMPLATES = {
+    'firebase_auth': _FIREBASE_AUTH_SERVICE_DART,
+}
+_AUTH_DEFAULT = _CUSTOM_AUTH_SERVICE_DART
+
+_DB_TEMPLATES = {
+    'sqlite': ('lib/services/database_service.dart', _SQLITE_SERVICE_DART),
+    'firebase_firestore': ('lib/services/firestore_service.dart', _FIRESTORE_SERVICE_DART),
+}
+
+_P2P_TEMPLATES = {
+    'flutter_nearby_connections': _P2P_NEARBY_DART,
+    'peerdart': _P2P_PEERDART_DART,
+}
+_P2P_DEFAULT = _P2P_ENET_DART  # enet_dart or unknown library
+
+
+# Templates with per-project substitutions (compiled once at import)
+
+_PUBSPEC_TEMPLATE = Template("""name: ${name}
+description: A Flutter ${app_category} template.
+publish_to: 'none'
+version: 1.0.0+1
+
+environment:
+  sdk: '>=3.5.0 <4.0.0'
+
+dependencies:
+  flutter:
+    sdk: flutter
+${dependencies}
+dev_dependencies:
+${dev_dependencies}
+flutter:
+  uses-material-design: true
+  
+  assets:
+    - assets/images/
+    - assets/icons/
+${extra_assets}""")
+
+_MAIN_DART_TEMPLATE = Template("""${imports}
+
+${prelude}class MyApp extends StatelessWidget {
+  const MyApp({super.key});
+
+  @override
+  Widget build(BuildContext context) {
+    return ${app_widget}(
+      title: '${project_name}',
+      debugShowCheckedModeBanner: false,
+${theme}${app_body}""")
+
+# main.dart fragments selected by preferences
+_BASIC_PRELUDE = """void main() {
+  runApp(const MyApp());
+}
+
+"""
+
+_MAIN_PRELUDES = {
+    'riverpod': """void main() {
+  runApp(
+    const ProviderScope(
+      child: MyApp(),
+    ),
+  );
+}
+
+""",
+    'provider': """void main() {
+  runApp(
+    MultiProvider(
+      providers: [
+        // Add your providers here
+      ],
+      child: const MyApp(),
+    ),
+  );
+}
+
+""",
+}
+
+_MAIN_THEME = """      theme: AppTheme.lightTheme,
+      darkTheme: AppTheme.darkTheme,
+      themeMode: ThemeMode.system,
+"""
+
+# has_routing -> (app widget, remainder of the file)
+_MAIN_APP_BODIES = {
+    True: ('MaterialApp.router', """      routerConfig: _router,
+    );
+  }
+}
+
+final GoRouter _router = GoRouter(
+  routes: [
+    GoRoute(
+      path: '/',
+      builder: (context, state) => const HomeScreen(),
+    ),
+    // Add more routes here
+  ],
+);
+"""),
+    False: ('MaterialApp', """      home: const HomeScreen(),
+    );
+  }
+}
+"""),
+}
+
+# Orientation preference -> DeviceOrientation values locked in main()
+_DEVICE_ORIENTATIONS = {
+    'portrait': '[DeviceOrientation.portraitUp, DeviceOrientation.portraitDown]',
+    'landscape': '[DeviceOrientation.landscapeLeft, DeviceOrientation.landscapeRight]',
+}
 
-linter:
-  rules:
-    - prefer_const_constructors
-    - prefer_const_literals_to_create_immutables
-    - avoid_print
-    - prefer_single_quotes
-    - require_trailing_commas
+# main.dart templates specialized per (state management, routing, theme,
+# orientation), leaving only ${project_name} to substitute
+_MAIN_TEMPLATE_CACHE: Dict[tuple, Template] = {}
 
-analyzer:
-  exclude:
-    - "**/*.g.dart"
-    - "**/*.freezed.dart"
-"""
-        (self.output_path / 'analysis_options.yaml').write_text(analysis_options)
+
+def _main_dart_template(state_mgmt: str, has_routing: bool, has_theme: bool,
+                        orientation: str = 'both') -> Template:
+    """Return the main.dart template specialized for the given choices."""
+    key = (state_mgmt, has_routing, has_theme, orientation)
+    template = _MAIN_TEMPLATE_CACHE.get(key)
+    if template is not None:
+        return template
     
-    def _generate_readme(self):
-        """Generate README.md file."""
-        readme = f"""# {self.project_name}
+    lock_orientation = orientation != 'both'
+    import_lines = (
+        ("import 'package:flutter/material.dart';", True),
+        ("import 'package:flutter/services.dart';", lock_orientation),
+        ("import 'package:provider/provider.dart';", state_mgmt == 'provider'),
+        ("import 'package:flutter_riverpod/flutter_riverpod.dart';", state_mgmt == 'riverpod'),
+        ("import 'package:flutter_bloc/flutter_bloc.dart';", state_mgmt == 'bloc'),
+        ("import 'package:go_router/go_router.dart';", has_routing),
+        ("import 'screens/home_screen.dart';", True),
+        ("import 'utils/theme.dart';", has_theme),
+    )
+    imports = [line for line, cond in import_lines if cond]
+    
+    prelude = _MAIN_PRELUDES.get(state_mgmt, _BASIC_PRELUDE)
+    if lock_orientation:
+        orientations = _DEVICE_ORIENTATIONS.get(orientation, _DEVICE_ORIENTATIONS['landscape'])
+        prelude = prelude.replace('void main() {', f"""Future<void> main() async {{
+  WidgetsFlutterBinding.ensureInitialized();
+
+  // Lock orientation to {orientation}
+  await SystemChrome.setPreferredOrientations({orientations});
+""", 1)
+    
+    app_widget, app_body = _MAIN_APP_BODIES[has_routing]
+    
+    # Fragments are Dart source, so '$' is escaped before it becomes template text
+    source = _MAIN_DART_TEMPLATE.safe_substitute(
+        imports="\n".join(imports).replace('$', '$$'),
+        prelude=prelude.replace('$', '$$'),
+        app_widget=app_widget,
+        theme=(_MAIN_THEME if has_theme else "").replace('$', '$$'),
+        app_body=app_body.replace('$', '$$'),
+    )
+    template = _MAIN_TEMPLATE_CACHE[key] = Template(source)
+    return template
 
-A Flutter {self.app_category} template generated with Flutter Template Generator.
+
+_README_TEMPLATE = Template("""# ${project_name}
+
+A Flutter ${app_category} template generated with Flutter Template Generator.
 
 ## Features
 
-- **App Type**: {self.preferences.get('app_category', 'N/A').title()}
-- **State Management**: {self.preferences.get('state_management', 'N/A').title()}
-- **Database**: {self.preferences.get('database', 'N/A').replace('_', ' ').title()}
-- **Authentication**: {'Yes' if self.preferences.get('has_auth', False) else 'No'}
-- **Routing**: {'Yes' if self.preferences.get('has_routing', True) else 'No'}
-- **Theme Management**: {'Yes' if self.preferences.get('has_theme', True) else 'No'}
+- **App Type**: ${app_type}
+- **State Management**: ${state_management}
+- **Database**: ${database}
+- **Authentication**: ${has_auth}
+- **Routing**: ${has_routing}
+- **Theme Management**: ${has_theme}
 
 ## Getting Started
 
@@ -1418,7 +1000,7 @@ lib/
 
 ### Database Setup
 
-{'Configure your SQLite database in `lib/services/database_service.dart`' if self.preferences.get('database') == 'sqlite' else 'Configure your database connection in the respective service files.'}
+${database_setup}
 
 ## Development
 
@@ -1427,6 +1009,619 @@ This template provides a solid foundation for your Flutter app. Customize it acc
 ## License
 
 MIT License
+""")
+
+
+
+class FlutterTemplateGenerator:
+    """Generates Flutter app templates based on preferences."""
+    
+    __slots__ = (
+        'preferences', 'project_name', 'output_path', 'app_category',
+        'state_mgmt', 'has_routing', 'has_theme', 'has_auth', 'database',
+        'game_engine', 'has_multiplayer', 'multiplayer_type', 'p2p_library',
+        'auth_provider', 'orientation', '_base', '_pkg_name', '_cache_key',
+        '_dependencies', '_dev_dependencies', '_has_firebase', '_pending_writes',
+        '_created_dirs',
+    )
+    
+    def __init__(self, preferences: Dict[str, Any], project_name: str, output_path: Path):
+        self.preferences = preferences
+        self.project_name = project_name
+        self.output_path = Path(output_path)
+        self.app_category = _intern(preferences.get('app_category', 'transactional app'))
+        
+        # Unpack frequently used preferences once; string choices are interned
+        # because they come from user input rather than source literals
+        p = preferences
+        self.state_mgmt = _intern(p.get('state_management', 'provider'))
+        self.has_routing = p.get('has_routing', True)
+        self.has_theme = p.get('has_theme', True)
+        self.has_auth = p.get('has_auth', False)
+        self.database = _intern(p.get('database', 'none'))
+        self.game_engine = _intern(p.get('game_engine', 'flame'))
+        self.has_multiplayer = p.get('has_multiplayer', False)
+        self.multiplayer_type = _intern(p.get('multiplayer_type'))
+        self.p2p_library = _intern(p.get('p2p_library', 'flutter_nearby_connections'))
+        self.auth_provider = _intern(p.get('auth_provider', 'firebase_auth'))
+        self.orientation = _intern(p.get('orientation', 'both'))
+        
+        self._base = str(self.output_path)
+        self._pkg_name = project_name.translate(_NAME_TABLE)
+        self._pending_writes: List[Tuple[str, bytes]] = []
+        self._created_dirs: List[str] = []
+        
+        # Resolved once; used by pubspec generation and iOS configuration
+        self._dependencies = Config.get_dependencies(preferences)
+        self._dev_dependencies = Config.get_dev_dependencies(preferences)
+        # Package names in Config are already lowercase
+        self._has_firebase = any('firebase' in dep for dep in self._dependencies)
+        self._cache_key = hashlib.blake2b(
+            repr(sorted(preferences.items())).encode('utf-8') + project_name.encode('utf-8'),
+            digest_size=16,
+        ).hexdigest()
+    
+    def _is_up_to_date(self) -> bool:
+        """Check whether the output was last generated from the same inputs."""
+        try:
+            with open(os.path.join(self._base, _CACHE_FILE), encoding='utf-8') as f:
+                if f.read().strip() != self._cache_key:
+                    return False
+        except OSError:
+            return False
+        # The stamp alone is not enough if key outputs were removed since
+        base = self._base
+        platforms = self.preferences.get('platforms', ['android', 'ios'])
+        return (
+            os.path.isfile(os.path.join(base, 'pubspec.yaml'))
+            and os.path.isfile(os.path.join(base, 'lib', 'main.dart'))
+            and all(os.path.isdir(os.path.join(base, platform)) for platform in platforms)
+        )
+    
+    def _emit(self, rel_path: str, content: Union[str, bytes]):
+        """Queue a file for the next _flush_writes()."""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        self._pending_writes.append((rel_path, content))
+    
+    def _flush_writes(self, executor: Executor) -> List[Future]:
+        """Submit every queued file to ``executor`` and return the futures."""
+        pending, self._pending_writes = self._pending_writes, []
+        
+        # Make sure every parent directory exists, once per directory, for
+        # paths not covered by _create_directory_structure()
+        created = self._created_dirs
+        parents = {os.path.dirname(rel_path) for rel_path, _ in pending}
+        parents.discard('')
+        for parent in parents:
+            if not any(d == parent or d.startswith(parent + '/') for d in created):
+                os.makedirs(os.path.join(self._base, parent), exist_ok=True)
+                created.append(parent)
+        
+        return [executor.submit(self._write_bytes, rel_path, data) for rel_path, data in pending]
+    
+    def _write(self, rel_path: str, text: str):
+        """Write UTF-8 text to a path relative to the project root."""
+        self._write_bytes(rel_path, text.encode('utf-8'))
+    
+    def _write_bytes(self, rel_path: str, encoded: bytes):
+        """Write bytes to a path relative to the project root.
+        
+        Files whose content is already identical are left untouched so their
+        modification times (and the Dart analyzer's caches) stay valid.
+        """
+        path = os.path.join(self._base, rel_path)
+        try:
+            if os.stat(path).st_size == len(encoded):
+                with open(path, 'rb') as f:
+                    if f.read() == encoded:
+                        return
+        except OSError:
+            pass
+        
+        data = memoryview(encoded)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _patch_file(path: Path, transform: Callable[[str], str]) -> bool:
+        """Read a file once, apply ``transform`` and write it back only if changed.
+        
+        Returns True when the file was rewritten.
+        """
+        original = path.read_text()
+        content = transform(original)
+        if content == original:
+            return False
+        path.write_text(content)
+        return True
+    
+    @staticmethod
+    def _run_buffered(step: Callable[[Callable[[str], None]], None]) -> List[str]:
+        """Run a configure step, collecting its messages instead of printing them."""
+        lines: List[str] = []
+        step(lines.append)
+        return lines
+    
+    def generate(self, force: bool = False):
+        """Generate the complete Flutter template.
+        
+        Unless ``force`` is set, nothing is done when the previous run used
+        identical inputs (see _is_up_to_date()).
+        """
+        if not force and self._is_up_to_date():
+            print(f"  Skipping generation: {_CACHE_FILE} shows the template is up to date.")
+            print("  Only key files are checked for changes; use --force to regenerate everything.")
+            return
+        
+        selected_platforms = self.preferences.get('platforms', ['android', 'ios'])
+        
+        # Create directory structure (must finish before any file is written).
+        # 'flutter create' makes its own default directories when it runs.
+        self._create_directory_structure(skip_flutter_defaults=bool(selected_platforms))
+        
+        # Generators only render content and queue it with _emit(); the queued
+        # files go to distinct paths, so they are written concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # 'flutter create' keeps existing files, so the ones it would also
+            # generate must be written before it runs
+            self._generate_pubspec()
+            self._generate_main_dart()
+            self._generate_config_files()
+            self._generate_readme()
+            for future in self._flush_writes(executor):
+                future.result()
+            
+            # The remaining files live in paths 'flutter create' never touches,
+            # so they are written while the platform folders are created
+            self._generate_app_structure()
+            futures = self._flush_writes(executor)
+            platforms_created = True
+            if selected_platforms:
+                platforms_created = self._create_platform_folders(selected_platforms)
+                if not platforms_created:
+                    # The default directories were left to 'flutter create'
+                    for directory in _FLUTTER_DEFAULT_DIRS:
+                        os.makedirs(os.path.join(self._base, directory), exist_ok=True)
+            
+            # Wait for every file and re-raise the first failure
+            for future in futures:
+                future.result()
+        
+        if selected_platforms:
+            # Configure orientation, iOS deployment target (especially for
+            # Firebase) and Android SDK versions after platform folders are
+            # created. Each step patches different files, so they run
+            # concurrently; their messages are buffered and written in order
+            # with a single write.
+            steps = (
+                self._configure_orientation,
+                self._configure_ios_deployment_target,
+                self._configure_android_sdk,
+            )
+            with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+                futures = [executor.submit(self._run_buffered, step) for step in steps]
+                lines = [line for future in futures for line in future.result()]
+            if lines:
+                sys.stdout.write('\n'.join(lines) + '\n')
+        else:
+            print("  ⚠️  No platforms selected. Skipping platform folder creation.")
+        
+        # Only a complete run may be skipped next time
+        if platforms_created:
+            self._write(_CACHE_FILE, self._cache_key + '\n')
+    
+    def _create_platform_folders(self, platforms: List[str]) -> bool:
+        """Run 'flutter create' to generate the selected platform folders.
+        
+        Returns True if 'flutter create' succeeded.
+        """
+        platforms_str = ','.join(platforms)
+        print(f"  Creating platform folders ({platforms_str})...")
+        try:
+            # Run flutter create to generate platform folders
+            # Use --project-name to match our project name
+            # Build the command with selected platforms
+            cmd = ['flutter', 'create', '--project-name', self._pkg_name, f'--platforms={platforms_str}', '.']
+            # Output is never shown, so let the child write straight to /dev/null
+            result = subprocess.run(
+                cmd,
+                cwd=self.output_path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            )
+            if result.returncode != 0:
+                # If that fails, try without project name (in case it conflicts)
+                result = subprocess.run(
+                    ['flutter', 'create', f'--platforms={platforms_str}', '.'],
+                    cwd=self.output_path,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False
+                )
+            if result.returncode != 0:
+                sys.stdout.write(
+                    "  ⚠️  Warning: 'flutter create' failed. Platform folders not created.\n"
+                    f"     Run 'flutter create --platforms={platforms_str} .' manually in the project directory.\n"
+                )
+                return False
+            return True
+        except FileNotFoundError:
+            sys.stdout.write(
+                "  ⚠️  Warning: Flutter not found in PATH. Platform folders not created.\n"
+                f"     Run 'flutter create --platforms={platforms_str} .' manually in the project directory.\n"
+            )
+            return False
+        except Exception as e:
+            sys.stdout.write(
+                f"  ⚠️  Warning: Could not create platform folders: {e}\n"
+                f"     Run 'flutter create --platforms={platforms_str} .' manually in the project directory.\n"
+            )
+            return False
+    
+    def _configure_orientation(self, log: Callable[[str], None] = print):
+        """Configure screen orientation for Android and iOS.
+        
+        main.dart already locks the orientation programmatically; see
+        _main_dart_template().
+        """
+        orientation = self.orientation
+        
+        if orientation == 'both':
+            return  # No need to lock orientation
+        
+        log(f"  Configuring orientation: {orientation}")
+        
+        # Configure Android
+        android_manifest = self.output_path / 'android' / 'app' / 'src' / 'main' / 'AndroidManifest.xml'
+        
+        # Map orientation to Android values
+        android_orientation = 'portrait' if orientation == 'portrait' else 'landscape'
+        
+        def add_screen_orientation(content: str) -> str:
+            # Check if screenOrientation already exists
+            if 'android:screenOrientation' in content:
+                return content
+            # Add screenOrientation to the main activity
+            return _RE_MAIN_ACTIVITY.sub(
+                rf'\1 android:screenOrientation="{android_orientation}">',
+                content
+            )
+        
+        try:
+            if self._patch_file(android_manifest, add_screen_orientation):
+                log(f"    ✓ Android configured for {orientation} mode")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"    ⚠️  Could not configure Android orientation: {e}")
+        
+        # Configure iOS - this is done via Info.plist
+        ios_info_plist = self.output_path / 'ios' / 'Runner' / 'Info.plist'
+        try:
+            content = ios_info_plist.read_text()
+            # Map orientation to iOS values
+            if orientation == 'portrait':
+                # Only allow portrait orientations
+                portrait_config = """    <key>UISupportedInterfaceOrientations</key>
+    <array>
+        <string>UIInterfaceOrientationPortrait</string>
+        <string>UIInterfaceOrientationPortraitUpsideDown</string>
+    </array>
+    <key>UISupportedInterfaceOrientations~ipad</key>
+    <array>
+        <string>UIInterfaceOrientationPortrait</string>
+        <string>UIInterfaceOrientationPortraitUpsideDown</string>
+    </array>"""
+            else:  # landscape
+                # Only allow landscape orientations
+                portrait_config = """    <key>UISupportedInterfaceOrientations</key>
+    <array>
+        <string>UIInterfaceOrientationLandscapeLeft</string>
+        <string>UIInterfaceOrientationLandscapeRight</string>
+    </array>
+    <key>UISupportedInterfaceOrientations~ipad</key>
+    <array>
+        <string>UIInterfaceOrientationLandscapeLeft</string>
+        <string>UIInterfaceOrientationLandscapeRight</string>
+    </array>"""
+            
+            # Check if orientation keys already exist
+            if 'UISupportedInterfaceOrientations' not in content:
+                # Add before closing </dict> tag
+                content = content.replace('</dict>', f'{portrait_config}\n</dict>')
+                ios_info_plist.write_text(content)
+                log(f"    ✓ iOS configured for {orientation} mode")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"    ⚠️  Could not configure iOS orientation: {e}")
+    
+    def _configure_ios_deployment_target(self, log: Callable[[str], None] = print):
+        """Configure iOS deployment target, using latest versions."""
+        # Use latest iOS version (17.0 is latest stable, Firebase requires 15.0 minimum)
+        # Using 17.0 for latest features and compatibility
+        min_ios_version = '17.0'
+        
+        if 'ios' not in self.preferences.get('platforms', ()):
+            return
+        
+        log(f"  Configuring iOS deployment target: {min_ios_version}")
+        
+        # Only raise versions below the minimum; newer targets are kept
+        min_version = _version_tuple(min_ios_version)
+        
+        def raise_platform(match):
+            if _version_tuple(match.group(1)) >= min_version:
+                return match.group(0)
+            return f"platform :ios, '{min_ios_version}'"
+        
+        def raise_deployment_target(match):
+            if _version_tuple(match.group(1)) >= min_version:
+                return match.group(0)
+            return f'IPHONEOS_DEPLOYMENT_TARGET = {min_ios_version};'
+        
+        # Update Podfile
+        podfile_path = self.output_path / 'ios' / 'Podfile'
+        
+        def set_ios_platform(content: str) -> str:
+            # Update platform line if it exists
+            content, found = _RE_IOS_PLATFORM.subn(raise_platform, content)
+            # Add platform line if it doesn't exist (shouldn't happen, but just in case)
+            if not found and 'platform :ios' not in content:
+                content = f"platform :ios, '{min_ios_version}'\n" + content
+            return content
+        
+        try:
+            if self._patch_file(podfile_path, set_ios_platform):
+                log(f"    ✓ Updated Podfile to iOS {min_ios_version}")
+            else:
+                log(f"    ✓ Podfile already targets iOS {min_ios_version} or later")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"    ⚠️  Could not update Podfile: {e}")
+        
+        # Update project.pbxproj (Xcode project file), falling back to the
+        # alternative location
+        ios_dir = self.output_path / 'ios'
+        for project_pbxproj_path in (
+            ios_dir / 'Runner.xcodeproj' / 'project.pbxproj',
+            ios_dir / 'Runner' / 'Runner.xcodeproj' / 'project.pbxproj',
+        ):
+            try:
+                # Update IPHONEOS_DEPLOYMENT_TARGET
+                # Find all occurrences and update them
+                original = project_pbxproj_path.read_text()
+                content, found = _RE_IPHONEOS_TARGET.subn(raise_deployment_target, original)
+                if not found:
+                    log(f"    ⚠️  Could not find IPHONEOS_DEPLOYMENT_TARGET in project file")
+                elif content != original:
+                    project_pbxproj_path.write_text(content)
+                    log(f"    ✓ Updated Xcode project to iOS {min_ios_version}")
+                else:
+                    log(f"    ✓ Xcode project already targets iOS {min_ios_version} or later")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                log(f"    ⚠️  Could not update Xcode project file: {e}")
+            break
+        
+        # Check if Firebase packages are being used
+        if self._has_firebase:
+            log(f"    ℹ️  iOS {min_ios_version} supports Firebase packages")
+    
+    def _configure_android_sdk(self, log: Callable[[str], None] = print):
+        """Configure Android SDK versions to use latest."""
+        if 'android' not in self.preferences.get('platforms', ()):
+            return
+        
+        log("  Configuring Android SDK versions (latest)...")
+        
+        # Latest Android versions (API 35 = Android 15)
+        min_sdk = 24  # Android 7.0 (Nougat) - reasonable minimum
+        target_sdk = 35  # Android 15 - latest
+        compile_sdk = 35  # Android 15 - latest
+        
+        # Update build.gradle
+        build_gradle_path = self.output_path / 'android' / 'app' / 'build.gradle'
+        
+        def set_sdk_versions(content: str) -> str:
+            # Update versions that are already set
+            content, has_min = _RE_MIN_SDK.subn(f'minSdkVersion {min_sdk}', content)
+            content, has_target = _RE_TARGET_SDK.subn(f'targetSdkVersion {target_sdk}', content)
+            content, has_compile = _RE_COMPILE_SDK.subn(f'compileSdkVersion {compile_sdk}', content)
+            
+            # Add missing min/target versions to defaultConfig in one splice
+            missing = ''
+            if not has_min:
+                missing += f'\n        minSdkVersion {min_sdk}'
+            if not has_target:
+                missing += f'\n        targetSdkVersion {target_sdk}'
+            if missing:
+                head, anchor, tail = content.partition('defaultConfig {')
+                if anchor:
+                    content = head + anchor + missing + tail
+            
+            # Add compileSdkVersion to the android block if missing
+            if not has_compile:
+                head, anchor, tail = content.partition('android {')
+                if anchor:
+                    content = head + anchor + f'\n    compileSdkVersion {compile_sdk}' + tail
+            return content
+        
+        try:
+            self._patch_file(build_gradle_path, set_sdk_versions)
+            log(f"    ✓ Updated Android SDK: min={min_sdk}, target={target_sdk}, compile={compile_sdk}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"    ⚠️  Could not update Android build.gradle: {e}")
+    
+    def _create_directory_structure(self, skip_flutter_defaults: bool = False):
+        """Create the Flutter project directory structure.
+        
+        With ``skip_flutter_defaults``, directories that 'flutter create'
+        generates itself are left to it.
+        """
+        directories = [
+            'lib',
+            'lib/models',
+            'lib/services',
+            'lib/repositories',
+            'lib/screens',
+            'lib/widgets',
+            'lib/utils',
+            'lib/constants',
+            'test',
+            'assets',
+            'assets/images',
+            'assets/icons',
+        ]
+        
+        # Category-specific directories
+        if self.app_category == 'game':
+            directories.extend([
+                'lib/game',
+                'lib/game/components',
+                'lib/game/systems',
+                'assets/sprites',
+                'assets/sounds',
+            ])
+        else:  # transactional app
+            directories.extend([
+                'lib/features',
+                'lib/providers',
+            ])
+        
+        # Auth directories
+        if self.has_auth:
+            directories.extend([
+                'lib/auth',
+                'lib/screens/auth',
+            ])
+        
+        # Create leaf directories only; makedirs creates their parents. Deeper
+        # paths come first, so a directory is skipped when it is the parent of
+        # one already created.
+        unique = set(directories)
+        if skip_flutter_defaults:
+            unique -= _FLUTTER_DEFAULT_DIRS
+        created = self._created_dirs
+        for directory in sorted(unique, key=len, reverse=True):
+            if not any(c.startswith(directory + '/') for c in created):
+                os.makedirs(os.path.join(self._base, directory), exist_ok=True)
+                created.append(directory)
+    
+    def _generate_pubspec(self):
+        """Generate pubspec.yaml file."""
+        extra_assets = ""
+        if self.app_category == 'game':
+            extra_assets = """    - assets/sprites/
+    - assets/sounds/
 """
-        (self.output_path / 'README.md').write_text(readme)
+        
+        pubspec_content = _PUBSPEC_TEMPLATE.substitute(
+            name=self._pkg_name,
+            app_category=self.app_category,
+            dependencies=_dependency_block(self._dependencies, _SDK_PACKAGES),
+            dev_dependencies=_dependency_block(self._dev_dependencies, _SDK_DEV_PACKAGES),
+            extra_assets=extra_assets,
+        )
+        self._emit('pubspec.yaml', pubspec_content)
+    
+    def _generate_main_dart(self):
+        """Generate main.dart file."""
+        template = _main_dart_template(
+            self.state_mgmt, bool(self.has_routing), bool(self.has_theme), self.orientation
+        )
+        main_content = template.substitute(project_name=self.project_name)
+        self._emit('lib/main.dart', main_content)
+    
+    def _generate_app_structure(self):
+        """Generate app structure files."""
+        is_game = self.app_category == 'game'
+        tasks = (
+            (True, self._generate_home_screen),
+            (self.has_theme, self._generate_theme_file),
+            (self.has_auth, self._generate_auth_files),
+            (self.database in _DB_TEMPLATES, self._generate_database_files),
+            (is_game, self._generate_game_files),
+            (not is_game, self._generate_transactional_files),
+        )
+        for cond, generator in tasks:
+            if cond:
+                generator()
+    
+    def _generate_home_screen(self):
+        """Generate home screen."""
+        self._emit('lib/screens/home_screen.dart', _HOME_SCREEN_DART)
+    
+    def _generate_theme_file(self):
+        """Generate theme configuration file."""
+        self._emit('lib/utils/theme.dart', _THEME_DART)
+    
+    def _generate_auth_files(self):
+        """Generate authentication-related files."""
+        # Auth service
+        content = _AUTH_TEMPLATES.get(self.auth_provider, _AUTH_DEFAULT)
+        self._emit('lib/auth/auth_service.dart', content)
+        
+        # Login screen
+        self._emit('lib/screens/auth/login_screen.dart', _LOGIN_SCREEN_DART)
+    
+    def _generate_database_files(self):
+        """Generate database-related files."""
+        template = _DB_TEMPLATES.get(self.database)
+        if template is None:
+            return  # No local database files (e.g. REST API only)
+        self._emit(*template)
+    
+    def _generate_game_files(self):
+        """Generate game-specific files."""
+        if self.game_engine.lower() == 'flame':
+            self._emit('lib/game/my_game.dart', _FLAME_GAME_DART)
+        
+        # Generate P2P multiplayer service if enabled
+        if self.has_multiplayer and self.multiplayer_type == 'p2p':
+            self._emit('lib/services/p2p_service.dart',
+                       _P2P_TEMPLATES.get(self.p2p_library, _P2P_DEFAULT))
+    
+    def _generate_transactional_files(self):
+        """Generate transactional app-specific files."""
+        # Example: Create a sample feature
+        self._emit('lib/features/example_feature.dart', _TRANSACTIONAL_EXAMPLE_DART)
+    
+    def _generate_config_files(self):
+        """Generate configuration files."""
+        # .gitignore
+        self._emit('.gitignore', _GITIGNORE)
+        
+        # Analysis options
+        self._emit('analysis_options.yaml', _ANALYSIS_OPTIONS)
+    
+    def _generate_readme(self):
+        """Generate README.md file."""
+        if self.database == 'sqlite':
+            database_setup = 'Configure your SQLite database in `lib/services/database_service.dart`'
+        else:
+            database_setup = 'Configure your database connection in the respective service files.'
+        
+        readme = _README_TEMPLATE.substitute(
+            project_name=self.project_name,
+            app_category=self.app_category,
+            app_type=self.preferences.get('app_category', 'N/A').title(),
+            state_management=self.preferences.get('state_management', 'N/A').title(),
+            database=self.preferences.get('database', 'N/A').replace('_', ' ').title(),
+            has_auth='Yes' if self.has_auth else 'No',
+            has_routing='Yes' if self.has_routing else 'No',
+            has_theme='Yes' if self.has_theme else 'No',
+            database_setup=database_setup,
+        )
+        self._emit('README.md', readme)
 
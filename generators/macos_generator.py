@@ -3,202 +3,131 @@ macOS native app template generator.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from string import Template
+from typing import Dict, Any, List, NamedTuple, Optional, Set, Tuple, Union
 
 
-class MacOSTemplateGenerator:
-    """Generates macOS native app templates based on preferences."""
-    
-    def __init__(self, preferences: Dict[str, Any], project_name: str, output_path: Path):
-        self.preferences = preferences
-        self.project_name = project_name
-        self.output_path = Path(output_path)
-        self.app_category = preferences.get('app_category', 'desktop app')
-        self.ui_framework = preferences.get('ui_framework', 'swiftui')
-    
-    def generate(self):
-        """Generate the complete macOS template."""
-        # Create directory structure
-        self._create_directory_structure()
-        
-        # Generate Xcode project files
-        self._generate_xcode_project()
-        
-        # Generate Swift source files
-        self._generate_swift_files()
-        
-        # Generate configuration files
-        self._generate_config_files()
-        
-        # Generate README
-        self._generate_readme()
-    
-    def _create_directory_structure(self):
-        """Create the macOS project directory structure."""
-        # Create main project directory
-        project_dir = self.output_path / self.project_name
-        project_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create source directories
-        source_dirs = [
-            'Views',
-            'Models',
-            'ViewModels',
-            'Services',
-            'Utils',
-            'Resources',
-        ]
-        
-        for dir_name in source_dirs:
-            (project_dir / dir_name).mkdir(parents=True, exist_ok=True)
-        
-        if self.preferences.get('has_auth', False):
-            (project_dir / 'Auth').mkdir(parents=True, exist_ok=True)
-        
-        if self.preferences.get('database') != 'none':
-            (project_dir / 'Data').mkdir(parents=True, exist_ok=True)
-        
-        # Create Xcode project directory
-        (project_dir / f'{self.project_name}.xcodeproj').mkdir(parents=True, exist_ok=True)
-    
-    def _generate_xcode_project(self):
-        """Generate basic Xcode project structure."""
-        project_name = self.project_name
-        bundle_id = f"com.example.{project_name.lower().replace(' ', '')}"
-        
-        # Generate Info.plist
-        info_plist = f"""<?xml version="1.0" encoding="UTF-8"?>
+_INFO_PLIST_TEMPLATE = Template("""<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
     <key>CFBundleDevelopmentRegion</key>
-    <string>$(DEVELOPMENT_LANGUAGE)</string>
+    <string>$$(DEVELOPMENT_LANGUAGE)</string>
     <key>CFBundleDisplayName</key>
-    <string>{project_name}</string>
+    <string>${project_name}</string>
     <key>CFBundleExecutable</key>
-    <string>$(EXECUTABLE_NAME)</string>
+    <string>$$(EXECUTABLE_NAME)</string>
     <key>CFBundleIdentifier</key>
-    <string>{bundle_id}</string>
+    <string>${bundle_id}</string>
     <key>CFBundleInfoDictionaryVersion</key>
     <string>6.0</string>
     <key>CFBundleName</key>
-    <string>$(PRODUCT_NAME)</string>
+    <string>$$(PRODUCT_NAME)</string>
     <key>CFBundlePackageType</key>
-    <string>$(PRODUCT_BUNDLE_PACKAGE_TYPE)</string>
+    <string>$$(PRODUCT_BUNDLE_PACKAGE_TYPE)</string>
     <key>CFBundleShortVersionString</key>
     <string>1.0</string>
     <key>CFBundleVersion</key>
     <string>1</string>
     <key>LSMinimumSystemVersion</key>
-    <string>$(MACOSX_DEPLOYMENT_TARGET)</string>
+    <string>$$(MACOSX_DEPLOYMENT_TARGET)</string>
     <key>NSHumanReadableCopyright</key>
     <string>Copyright © 2024. All rights reserved.</string>
     <key>NSMainStoryboardFile</key>
     <string>Main</string>
     <key>NSPrincipalClass</key>
     <string>NSApplication</string>
-"""
-        
-        if not self.preferences.get('has_dock_icon', True):
-            info_plist += """    <key>LSUIElement</key>
+${dock_icon_block}${file_access_block}</dict>
+</plist>
+""")
+
+_DOCK_ICON_FRAGMENT = """    <key>LSUIElement</key>
     <true/>
 """
-        
-        if self.preferences.get('has_file_access', False):
-            info_plist += """    <key>NSDocumentsFolderUsageDescription</key>
+
+_FILE_ACCESS_FRAGMENT = """    <key>NSDocumentsFolderUsageDescription</key>
     <string>This app needs access to your documents folder.</string>
     <key>NSDownloadsFolderUsageDescription</key>
     <string>This app needs access to your downloads folder.</string>
 """
-        
-        info_plist += """</dict>
-</plist>
-"""
-        
-        (self.output_path / self.project_name / 'Info.plist').write_text(info_plist)
-        
-        # Generate basic project.pbxproj structure (simplified)
-        # Note: Full Xcode project generation is complex, this is a basic structure
-        project_pbxproj = f"""// !$*UTF8*$!
-{{
+
+# Placeholder only; a complete Xcode project needs a full pbxproj file, so
+# users will need to create the project in Xcode
+_PROJECT_PBXPROJ = b"""// !$*UTF8*$!
+{
     archiveVersion = 1;
-    classes = {{
-    }};
+    classes = {
+    };
     objectVersion = 56;
-    objects = {{
-    }};
+    objects = {
+    };
     rootObject = /* Project object */;
-}}
+}
 """
-        # For a complete Xcode project, you'd need a full pbxproj file
-        # This is a placeholder - users will need to create the project in Xcode
-        (self.output_path / self.project_name / f'{self.project_name}.xcodeproj/project.pbxproj').write_text(project_pbxproj)
-    
-    def _generate_swift_files(self):
-        """Generate Swift source files."""
-        project_name = self.project_name
-        
-        if self.ui_framework == 'swiftui':
-            self._generate_swiftui_app(project_name)
-        else:
-            self._generate_appkit_app(project_name)
-        
-        # Generate ContentView
-        self._generate_content_view()
-        
-        # Generate services if needed
-        if self.preferences.get('has_auth', False):
-            self._generate_auth_service()
-        
-        if self.preferences.get('database') != 'none':
-            self._generate_database_service()
-    
-    def _generate_swiftui_app(self, project_name: str):
-        """Generate SwiftUI App file."""
-        app_content = f"""import SwiftUI
+
+_SWIFTUI_APP_HEADER = Template("""import SwiftUI
 
 @main
-struct {project_name.replace(' ', '')}App: App {{
-"""
-        
-        if self.preferences.get('has_menu_bar', True):
-            app_content += """    @NSApplicationDelegateAdaptor(AppDelegate.self) var appDelegate
+struct ${app_struct}App: App {
+""")
+
+_SWIFTUI_DELEGATE_ADAPTOR = """    @NSApplicationDelegateAdaptor(AppDelegate.self) var appDelegate
     
 """
-        
-        app_content += f"""    var body: some Scene {{
+
+_SWIFTUI_BODY_OPEN = """    var body: some Scene {
 """
-        
-        if self.app_category == 'menu bar app':
-            app_content += """        MenuBarExtra("App", systemImage: "star") {
+
+_SWIFTUI_MENU_BAR_SCENE = """        MenuBarExtra("App", systemImage: "star") {
             ContentView()
         }
         .menuBarExtraStyle(.window)
 """
-        else:
-            app_content += f"""        WindowGroup {{
+
+_SWIFTUI_WINDOW_SCENE = """        WindowGroup {
             ContentView()
-        }}
+        }
         .windowStyle(.automatic)
 """
-        
-        if self.preferences.get('has_menu_bar', True):
-            app_content += """
+
+_SWIFTUI_SETTINGS_SCENE = """
         Settings {
             SettingsView()
         }
 """
-        
-        app_content += """    }
+
+_SWIFTUI_APP_FOOTER = """    }
 }
 """
-        
-        (self.output_path / self.project_name / f'{project_name.replace(" ", "")}App.swift').write_text(app_content)
-        
-        # Generate AppDelegate if menu bar is enabled
-        if self.preferences.get('has_menu_bar', True):
-            app_delegate = """import AppKit
+
+# SwiftUI App templates specialized per (menu bar, menu bar app), leaving
+# only ${app_struct} to substitute
+_SWIFTUI_APP_CACHE: Dict[tuple, Template] = {}
+
+
+def _swiftui_app_template(has_menu_bar: bool, menu_bar_app: bool) -> Template:
+    """Return the SwiftUI App template specialized for the given choices."""
+    key = (has_menu_bar, menu_bar_app)
+    template = _SWIFTUI_APP_CACHE.get(key)
+    if template is not None:
+        return template
+    
+    parts = [_SWIFTUI_APP_HEADER.template]
+    if has_menu_bar:
+        parts.append(_SWIFTUI_DELEGATE_ADAPTOR)
+    parts.append(_SWIFTUI_BODY_OPEN)
+    parts.append(_SWIFTUI_MENU_BAR_SCENE if menu_bar_app else _SWIFTUI_WINDOW_SCENE)
+    if has_menu_bar:
+        parts.append(_SWIFTUI_SETTINGS_SCENE)
+    parts.append(_SWIFTUI_APP_FOOTER)
+    
+    template = _SWIFTUI_APP_CACHE[key] = Template(''.join(parts))
+    return template
+
+
+_SWIFTUI_APP_DELEGATE = b"""import AppKit
 import SwiftUI
 
 class AppDelegate: NSObject, NSApplicationDelegate {
@@ -215,17 +144,14 @@ class AppDelegate: NSObject, NSApplicationDelegate {
     }
 }
 """
-            (self.output_path / self.project_name / 'AppDelegate.swift').write_text(app_delegate)
-    
-    def _generate_appkit_app(self, project_name: str):
-        """Generate AppKit App file."""
-        app_content = f"""import Cocoa
+
+_APPKIT_APP = Template("""import Cocoa
 
 @main
-class AppDelegate: NSObject, NSApplicationDelegate {{
+class AppDelegate: NSObject, NSApplicationDelegate {
     var window: NSWindow!
     
-    func applicationDidFinishLaunching(_ aNotification: Notification) {{
+    func applicationDidFinishLaunching(_ aNotification: Notification) {
         // Create the window
         let contentRect = NSRect(x: 0, y: 0, width: 800, height: 600)
         let windowStyle: NSWindow.StyleMask = [.titled, .closable, .miniaturizable, .resizable]
@@ -237,30 +163,26 @@ class AppDelegate: NSObject, NSApplicationDelegate {{
             defer: false
         )
         
-        window.title = "{project_name}"
+        window.title = "${project_name}"
         window.center()
         window.makeKeyAndOrderFront(nil)
         
         // Set content view
         let contentView = ContentView()
         window.contentView = NSHostingView(rootView: contentView)
-    }}
+    }
     
-    func applicationWillTerminate(_ aNotification: Notification) {{
+    func applicationWillTerminate(_ aNotification: Notification) {
         // Insert code here to tear down your application
-    }}
+    }
     
-    func applicationShouldTerminateAfterLastWindowClosed(_ sender: NSApplication) -> Bool {{
+    func applicationShouldTerminateAfterLastWindowClosed(_ sender: NSApplication) -> Bool {
         return true
-    }}
-}}
-"""
-        (self.output_path / self.project_name / 'AppDelegate.swift').write_text(app_content)
-    
-    def _generate_content_view(self):
-        """Generate ContentView."""
-        if self.ui_framework == 'swiftui':
-            content_view = """import SwiftUI
+    }
+}
+""")
+
+_SWIFTUI_CONTENT_VIEW = b"""import SwiftUI
 
 struct ContentView: View {
     @State private var counter = 0
@@ -301,8 +223,8 @@ struct ContentView_Previews: PreviewProvider {
     }
 }
 """
-        else:
-            content_view = """import SwiftUI
+
+_APPKIT_CONTENT_VIEW = b"""import SwiftUI
 
 struct ContentView: View {
     var body: some View {
@@ -320,12 +242,8 @@ struct ContentView: View {
     }
 }
 """
-        
-        (self.output_path / self.project_name / 'Views/ContentView.swift').write_text(content_view)
-        
-        # Generate SettingsView if menu bar is enabled
-        if self.preferences.get('has_menu_bar', True) and self.ui_framework == 'swiftui':
-            settings_view = """import SwiftUI
+
+_SETTINGS_VIEW = b"""import SwiftUI
 
 struct SettingsView: View {
     @AppStorage("showNotifications") private var showNotifications = true
@@ -339,14 +257,8 @@ struct SettingsView: View {
     }
 }
 """
-            (self.output_path / self.project_name / 'Views/SettingsView.swift').write_text(settings_view)
-    
-    def _generate_auth_service(self):
-        """Generate authentication service."""
-        auth_provider = self.preferences.get('auth_provider', 'keychain')
-        
-        if auth_provider == 'keychain':
-            auth_service = """import Foundation
+
+_KEYCHAIN_AUTH_SERVICE = b"""import Foundation
 import Security
 
 class AuthService {
@@ -398,8 +310,8 @@ class AuthService {
     }
 }
 """
-        else:
-            auth_service = """import Foundation
+
+_CUSTOM_AUTH_SERVICE = b"""import Foundation
 
 class AuthService {
     // TODO: Implement your authentication logic here
@@ -419,15 +331,8 @@ class AuthService {
     }
 }
 """
-        
-        (self.output_path / self.project_name / 'Auth/AuthService.swift').write_text(auth_service)
-    
-    def _generate_database_service(self):
-        """Generate database service."""
-        database = self.preferences.get('database', 'core_data')
-        
-        if database == 'core_data':
-            db_service = """import CoreData
+
+_CORE_DATA_SERVICE = b"""import CoreData
 import Foundation
 
 class DatabaseService {
@@ -459,8 +364,8 @@ class DatabaseService {
     }
 }
 """
-        elif database == 'sqlite':
-            db_service = """import Foundation
+
+_SQLITE_SERVICE = b"""import Foundation
 import SQLite3
 
 class DatabaseService {
@@ -497,20 +402,28 @@ class DatabaseService {
     }
 }
 """
-        else:
-            db_service = """import Foundation
+
+_DEFAULT_DB_SERVICE = b"""import Foundation
 
 class DatabaseService {
     // TODO: Implement your database logic here
 }
 """
-        
-        (self.output_path / self.project_name / 'Services/DatabaseService.swift').write_text(db_service)
-    
-    def _generate_config_files(self):
-        """Generate configuration files."""
-        # .gitignore
-        gitignore = """# Xcode
+
+# Choice -> template; unknown choices fall back to the *_DEFAULT entry
+_CONTENT_VIEWS = {'swiftui': _SWIFTUI_CONTENT_VIEW}
+_CONTENT_VIEW_DEFAULT = _APPKIT_CONTENT_VIEW
+
+_AUTH_SERVICES = {'keychain': _KEYCHAIN_AUTH_SERVICE}
+_AUTH_SERVICE_DEFAULT = _CUSTOM_AUTH_SERVICE
+
+_DB_SERVICES = {
+    'core_data': _CORE_DATA_SERVICE,
+    'sqlite': _SQLITE_SERVICE,
+}
+_DB_SERVICE_DEFAULT = _DEFAULT_DB_SERVICE
+
+_GITIGNORE = b"""# Xcode
 #
 # gitignore contributors: remember to update Global/Xcode.gitignore, Objective-C.gitignore & Swift.gitignore
 
@@ -625,25 +538,18 @@ Network Trash Folder
 Temporary Items
 .apdisk
 """
-        (self.output_path / self.project_name / '.gitignore').write_text(gitignore)
-    
-    def _generate_readme(self):
-        """Generate README.md file."""
-        project_name = self.project_name
-        ui_framework = self.preferences.get('ui_framework', 'swiftui').upper()
-        app_category = self.preferences.get('app_category', 'desktop app').title()
-        
-        readme = f"""# {project_name}
+
+_README_TEMPLATE = Template("""# ${project_name}
 
 A macOS native app template generated with Template Generator.
 
 ## Features
 
 - **Platform**: macOS Native
-- **UI Framework**: {ui_framework}
-- **App Type**: {app_category}
-- **Database**: {self.preferences.get('database', 'none').replace('_', ' ').title()}
-- **Authentication**: {'Yes' if self.preferences.get('has_auth', False) else 'No'}
+- **UI Framework**: ${ui_framework}
+- **App Type**: ${app_category}
+- **Database**: ${database}
+- **Authentication**: ${has_auth}
 
 ## Getting Started
 
@@ -657,7 +563,7 @@ A macOS native app template generated with Template Generator.
 
 1. Open the project in Xcode:
    ```bash
-   open {project_name}/{project_name}.xcodeproj
+   open ${project_name}/${project_name}.xcodeproj
    ```
 
 2. Configure your bundle identifier in the project settings
@@ -669,8 +575,8 @@ A macOS native app template generated with Template Generator.
 ## Project Structure
 
 ```
-{project_name}/
-├── {project_name}/
+${project_name}/
+├── ${project_name}/
 │   ├── Views/          # SwiftUI views
 │   ├── Models/         # Data models
 │   ├── ViewModels/     # View models (MVVM)
@@ -678,7 +584,7 @@ A macOS native app template generated with Template Generator.
 │   ├── Auth/           # Authentication logic
 │   ├── Data/           # Database/data layer
 │   └── Utils/          # Utility functions
-└── {project_name}.xcodeproj/
+└── ${project_name}.xcodeproj/
 ```
 
 ## Configuration
@@ -687,12 +593,12 @@ A macOS native app template generated with Template Generator.
 
 Update the bundle identifier in `Info.plist` to match your organization:
 ```
-com.example.{project_name.lower().replace(' ', '')}
+com.example.${bundle_suffix}
 ```
 
 ### Database Setup
 
-{'Configure your Core Data model in Xcode' if self.preferences.get('database') == 'core_data' else 'Configure your database connection in the respective service files.'}
+${database_setup}
 
 ## Development
 
@@ -701,6 +607,272 @@ This template provides a solid foundation for your macOS app. Customize it accor
 ## License
 
 MIT License
-"""
-        (self.output_path / self.project_name / 'README.md').write_text(readme)
+""")
+
+
+def _specialize(template: Template, **fields: str) -> Template:
+    """Bake ``fields`` into ``template``, leaving its other placeholders."""
+    source = template.template
+    for name, value in fields.items():
+        source = source.replace('${%s}' % name, value.replace('$', '$$'))
+    return Template(source)
+
+
+class _MacPreset(NamedTuple):
+    """Templates resolved for one combination of preferences.
+    
+    Only the project name and the identifiers derived from it are left to
+    substitute, so generators with equal preferences share one preset.
+    """
+    
+    info_plist: Template
+    app: Template
+    readme: Template
+
+
+# Presets keyed by the preferences that shape Info.plist, the app file and
+# the README
+_PRESET_CACHE: Dict[tuple, _MacPreset] = {}
+
 
+def _mac_preset(ui_framework: str, app_category: str, database: Optional[str],
+                has_auth: bool, has_menu_bar: bool, has_dock_icon: bool,
+                has_file_access: bool) -> _MacPreset:
+    """Return the preset for the given choices, building it on first use."""
+    key = (ui_framework, app_category, database, has_auth, has_menu_bar,
+           has_dock_icon, has_file_access)
+    preset = _PRESET_CACHE.get(key)
+    if preset is not None:
+        return preset
+    
+    info_plist = _specialize(
+        _INFO_PLIST_TEMPLATE,
+        dock_icon_block='' if has_dock_icon else _DOCK_ICON_FRAGMENT,
+        file_access_block=_FILE_ACCESS_FRAGMENT if has_file_access else '',
+    )
+    
+    if ui_framework == 'swiftui':
+        app = _swiftui_app_template(has_menu_bar, app_category == 'menu bar app')
+    else:
+        app = _APPKIT_APP
+    
+    database = database or 'none'
+    if database == 'core_data':
+        database_setup = 'Configure your Core Data model in Xcode'
+    else:
+        database_setup = 'Configure your database connection in the respective service files.'
+    readme = _specialize(
+        _README_TEMPLATE,
+        ui_framework=ui_framework.upper(),
+        app_category=app_category.title(),
+        database=database.replace('_', ' ').title(),
+        has_auth='Yes' if has_auth else 'No',
+        database_setup=database_setup,
+    )
+    
+    preset = _PRESET_CACHE[key] = _MacPreset(info_plist, app, readme)
+    return preset
+
+
+class MacOSTemplateGenerator:
+    """Generates macOS native app templates based on preferences."""
+    
+    __slots__ = (
+        'preferences', 'project_name', 'output_path', 'app_category',
+        'ui_framework', 'has_auth', 'auth_provider', 'database', 'has_menu_bar',
+        'has_dock_icon', 'has_file_access', '_project_dir', '_swift_ident',
+        '_bundle_suffix', '_preset', '_pending_writes', '_created_dirs',
+    )
+    
+    def __init__(self, preferences: Dict[str, Any], project_name: str, output_path: Path):
+        self.preferences = preferences
+        self.project_name = project_name
+        self.output_path = Path(output_path)
+        self.app_category = preferences.get('app_category', 'desktop app')
+        self.ui_framework = preferences.get('ui_framework', 'swiftui')
+        
+        # Unpack frequently used preferences once
+        p = preferences
+        self.has_auth = p.get('has_auth', False)
+        self.auth_provider = p.get('auth_provider', 'keychain')
+        self.database = p.get('database')
+        self.has_menu_bar = p.get('has_menu_bar', True)
+        self.has_dock_icon = p.get('has_dock_icon', True)
+        self.has_file_access = p.get('has_file_access', False)
+        
+        # Derived once from the project name
+        self._project_dir = self.output_path / project_name
+        self._swift_ident = project_name.replace(' ', '')
+        self._bundle_suffix = project_name.lower().replace(' ', '')
+        
+        # Shared with every generator that has the same preferences
+        self._preset = _mac_preset(
+            self.ui_framework, self.app_category, self.database,
+            bool(self.has_auth), bool(self.has_menu_bar),
+            bool(self.has_dock_icon), bool(self.has_file_access),
+        )
+        
+        self._pending_writes: List[Tuple[str, bytes]] = []
+        self._created_dirs: Set[str] = set()
+    
+    def generate(self):
+        """Generate the complete macOS template."""
+        # Create directory structure
+        self._create_directory_structure()
+        
+        # Generate Xcode project files
+        self._generate_xcode_project()
+        
+        # Generate Swift source files
+        self._generate_swift_files()
+        
+        # Generate configuration files
+        self._generate_config_files()
+        
+        # Generate README
+        self._generate_readme()
+        
+        # Write every queued file in one pass
+        self._flush_writes()
+    
+    def _emit(self, rel_path: str, content: Union[str, bytes]):
+        """Queue a file, relative to the project directory, for _flush_writes()."""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        self._pending_writes.append((rel_path, content))
+    
+    def _flush_writes(self):
+        """Write every queued file concurrently and clear the queue.
+        
+        Directories must already exist; the writes are independent of each
+        other and bound by syscall latency, so they run on a thread pool.
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        if not pending:
+            return
+        for parent in {os.path.dirname(rel_path) for rel_path, _ in pending}:
+            if parent:
+                self._ensure_dir(parent)
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            # Consume the results so a failed write is raised here
+            list(executor.map(lambda item: self._write_bytes(*item), pending))
+    
+    def _write_bytes(self, rel_path: str, encoded: bytes):
+        """Write bytes to a path relative to the project directory."""
+        data = memoryview(encoded)
+        fd = os.open(os.path.join(self._project_dir, rel_path),
+                     os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+    
+    def _ensure_dir(self, rel_dir: str):
+        """Create a directory under the project directory unless already done."""
+        if rel_dir in self._created_dirs:
+            return
+        path = os.path.join(self._project_dir, rel_dir)
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+        self._created_dirs.add(rel_dir)
+    
+    def _create_directory_structure(self):
+        """Create the macOS project directory structure."""
+        # Leaf directories only; makedirs creates the project directory
+        # along with the first of them
+        leaves = {
+            'Views',
+            'Models',
+            'ViewModels',
+            'Services',
+            'Utils',
+            'Resources',
+            f'{self.project_name}.xcodeproj',
+        }
+        
+        if self.has_auth:
+            leaves.add('Auth')
+        
+        if self.database != 'none':
+            leaves.add('Data')
+        
+        for dir_name in leaves:
+            self._ensure_dir(dir_name)
+    
+    def _generate_xcode_project(self):
+        """Generate basic Xcode project structure."""
+        project_name = self.project_name
+        bundle_id = f"com.example.{self._bundle_suffix}"
+        
+        # Generate Info.plist
+        info_plist = self._preset.info_plist.substitute(
+            project_name=project_name, bundle_id=bundle_id)
+        self._emit('Info.plist', info_plist)
+        
+        # Generate basic project.pbxproj structure (simplified)
+        self._emit(f'{self.project_name}.xcodeproj/project.pbxproj', _PROJECT_PBXPROJ)
+    
+    def _generate_swift_files(self):
+        """Generate Swift source files."""
+        project_name = self.project_name
+        
+        if self.ui_framework == 'swiftui':
+            self._generate_swiftui_app(project_name)
+        else:
+            self._generate_appkit_app(project_name)
+        
+        # Generate ContentView
+        self._generate_content_view()
+        
+        # Generate services if needed
+        if self.has_auth:
+            self._generate_auth_service()
+        
+        if self.database != 'none':
+            self._generate_database_service()
+    
+    def _generate_swiftui_app(self, project_name: str):
+        """Generate SwiftUI App file."""
+        self._emit(f'{self._swift_ident}App.swift',
+                   self._preset.app.substitute(app_struct=self._swift_ident))
+        
+        # Generate AppDelegate if menu bar is enabled
+        if self.has_menu_bar:
+            self._emit('AppDelegate.swift', _SWIFTUI_APP_DELEGATE)
+    
+    def _generate_appkit_app(self, project_name: str):
+        """Generate AppKit App file."""
+        self._emit('AppDelegate.swift', self._preset.app.substitute(project_name=project_name))
+    
+    def _generate_content_view(self):
+        """Generate ContentView."""
+        self._emit('Views/ContentView.swift',
+                   _CONTENT_VIEWS.get(self.ui_framework, _CONTENT_VIEW_DEFAULT))
+        
+        # Generate SettingsView if menu bar is enabled
+        if self.has_menu_bar and self.ui_framework == 'swiftui':
+            self._emit('Views/SettingsView.swift', _SETTINGS_VIEW)
+    
+    def _generate_auth_service(self):
+        """Generate authentication service."""
+        self._emit('Auth/AuthService.swift',
+                   _AUTH_SERVICES.get(self.auth_provider, _AUTH_SERVICE_DEFAULT))
+    
+    def _generate_database_service(self):
+        """Generate database service."""
+        # A missing database preference defaults to Core Data
+        database = self.database or 'core_data'
+        self._emit('Services/DatabaseService.swift',
+                   _DB_SERVICES.get(database, _DB_SERVICE_DEFAULT))
+    
+    def _generate_config_files(self):
+        """Generate configuration files."""
+        # .gitignore
+        self._emit('.gitignore', _GITIGNORE)
+    
+    def _generate_readme(self):
+        """Generate README.md file."""
+        readme = self._preset.readme.substitute(
+            project_name=self.project_name, bundle_suffix=self._bundle_suffix)
+        self._emit('README.md', readme)
@@ -4,24 +4,94 @@ Template Generator
 An interactive tool to generate app templates (Flutter, macOS, etc.) based on user preferences.
 """
 
+import argparse
+import json
 import os
 import sys
 from pathlib import Path
 from questions import QuestionHandler
-from generators.flutter_generator import FlutterTemplateGenerator
-from generators.macos_generator import MacOSTemplateGenerator
 from config import Config
 
 
-def main():
+def _answer_reader():
+    """Return a callable that reads one answer per prompt.
+    
+    Piped input is drained with a single read; interactive sessions keep
+    using input().
+    """
+    if sys.stdin.isatty():
+        return input
+    
+    lines = iter(sys.stdin.read().splitlines())
+    
+    def read_answer(prompt: str) -> str:
+        sys.stdout.write(prompt)
+        return next(lines, '')
+    
+    return read_answer
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Generate app templates based on your answers.")
+    parser.add_argument(
+        '--use-cache', action='store_true',
+        help="reuse the answers from a previous run with the same platform and app type, "
+             "and save this run's answers for later",
+    )
+    parser.add_argument(
+        '--answers-file', type=Path,
+        help="JSON list of answers to the preference questions, in order",
+    )
+    parser.add_argument(
+        '--force', action='store_true',
+        help="regenerate even if the output is marked up to date by .template_cache",
+    )
+    args = parser.parse_args(argv)
+    args.answers = None
+    if args.answers_file:
+        args.answers = _load_answers(parser, args.answers_file)
+    return args
+
+
+def _load_answers(parser: argparse.ArgumentParser, path: Path) -> list:
+    """Read the answers file, reporting problems through the parser."""
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except OSError as e:
+        parser.error(f"cannot read answers file {path}: {e.strerror or e}")
+    except ValueError as e:
+        parser.error(f"answers file {path} is not valid JSON: {e}")
+    
+    if not isinstance(data, list):
+        parser.error(f"answers file {path} must contain a JSON list")
+    
+    answers = []
+    for index, answer in enumerate(data):
+        if isinstance(answer, bool):
+            # JSON true/false answer the yes/no prompts
+            answers.append('y' if answer else 'n')
+        elif isinstance(answer, str):
+            answers.append(answer)
+        else:
+            parser.error(
+                f"answers file {path}: item {index} must be a string or boolean, "
+                f"got {json.dumps(answer)}"
+            )
+    return answers
+
+
+def main(argv=None):
     """Main entry point for the template generator."""
+    args = _parse_args(argv)
+    
     print("=" * 60)
     print("🚀 Template Generator")
     print("=" * 60)
     print()
     
     # Initialize question handler
-    question_handler = QuestionHandler()
+    question_handler = QuestionHandler(replay=args.use_cache, answers=args.answers)
     
     # Collect user preferences
     preferences = question_handler.collect_preferences()
@@ -35,13 +105,14 @@ def main():
     print()
     
     # Confirm before generating
-    confirm = input("Proceed with template generation? (y/n): ").strip().lower()
+    ask = _answer_reader()
+    confirm = ask("Proceed with template generation? (y/n): ").strip().lower()
     if confirm != 'y':
         print("Template generation cancelled.")
         return
     
     # Get project name and path
-    project_name = input("\nEnter project name: ").strip()
+    project_name = ask("\nEnter project name: ").strip()
     if not project_name:
         print("Error: Project name cannot be empty.")
         return
@@ -51,7 +122,7 @@ def main():
     base_path.mkdir(parents=True, exist_ok=True)
     
     default_path = base_path / project_name
-    output_path = input(f"Enter output directory (default: {default_path}): ").strip()
+    output_path = ask(f"Enter output directory (default: {default_path}): ").strip()
     if not output_path:
         output_path = default_path
     else:
@@ -62,10 +133,13 @@ def main():
         # Convert to absolute path to ensure consistency
         output_path = output_path.resolve()
     
-    # Initialize generator based on app type
+    # Initialize generator based on app type; only the selected generator
+    # module is imported
     if preferences['app_type'] == 'flutter':
+        from generators.flutter_generator import FlutterTemplateGenerator
         generator = FlutterTemplateGenerator(preferences, project_name, output_path)
     elif preferences['app_type'] == 'macos':
+        from generators.macos_generator import MacOSTemplateGenerator
         generator = MacOSTemplateGenerator(preferences, project_name, output_path)
     else:
         print(f"Error: App type '{preferences['app_type']}' not yet supported.")
@@ -74,7 +148,11 @@ def main():
     # Generate template
     try:
         print(f"\n📦 Generating template at: {output_path.absolute()}")
-        generator.generate()
+        if preferences['app_type'] == 'flutter':
+            # Only the Flutter generator skips up-to-date output
+            generator.generate(force=args.force)
+        else:
+            generator.generate()
         print("\n✅ Template generated successfully!")
         print(f"\nNext steps:")
         if preferences['app_type'] == 'flutter':
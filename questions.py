@@ -2,40 +2,421 @@
 Question handler module for collecting user preferences.
 """
 
+import hashlib
+import json
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# Answers from previous runs, keyed by platform and app category
+_DEFAULT_CACHE_PATH = Path.home() / '.py_templates' / 'prefs.json'
+
+
+# Multi-line help blocks, each written with a single call
+_PLATFORM_HELP = (
+    "\n"
+    "============================================================\n"
+    "Platform Selection:\n"
+    "============================================================\n"
+    "Which platforms do you want to support?\n"
+    "(You can select multiple platforms)\n"
+    "============================================================\n"
+)
+
+_ORIENTATION_HELP = (
+    "\n"
+    "============================================================\n"
+    "Screen Orientation:\n"
+    "============================================================\n"
+    "Portrait mode: Phone held vertically (taller than wide)\n"
+    "  • Best for: Reading, scrolling, forms, social media\n"
+    "  • Example: Most apps like Instagram, Twitter, WhatsApp\n"
+    "\n"
+    "Landscape mode: Phone held horizontally (wider than tall)\n"
+    "  • Best for: Games, videos, spreadsheets, presentations\n"
+    "  • Example: Video players, racing games, calculators\n"
+    "\n"
+    "Both: App can rotate between portrait and landscape\n"
+    "  • Best for: Apps that benefit from both orientations\n"
+    "============================================================\n"
+)
+
+_STATE_MGMT_HELP = (
+    "\n"
+    "============================================================\n"
+    "State Management Explanation:\n"
+    "============================================================\n"
+    "State management helps you manage data that changes in your app.\n"
+    "For example: user login status, shopping cart items, game scores, etc.\n"
+    "\n"
+    "Quick guide:\n"
+    "  • Provider: Simple, recommended for beginners (official Flutter)\n"
+    "  • Riverpod: Modern, type-safe, great for larger apps\n"
+    "  • Bloc: Pattern-based, good for complex business logic\n"
+    "  • GetX: All-in-one solution, very popular\n"
+    "  • Redux: Predictable state container, from web development\n"
+    "============================================================\n"
+)
+
+_GAME_ROUTING_HELP = (
+    "\n"
+    "------------------------------------------------------------\n"
+    "Routing/Navigation for Games:\n"
+    "------------------------------------------------------------\n"
+    "Routing helps you navigate between different screens:\n"
+    "  ✓ Main Menu → Game Screen → Game Over → Settings\n"
+    "  ✓ Level Selection → Game → Pause Menu\n"
+    "  ✓ Leaderboard, Shop, Profile screens\n"
+    "\n"
+    "Without routing: You'd manage all screens manually\n"
+    "With routing: Clean navigation between screens\n"
+    "\n"
+    "Simple single-screen games might not need routing.\n"
+    "Games with menus, levels, or multiple screens benefit from it.\n"
+    "------------------------------------------------------------\n"
+)
+
+_ROUTING_HELP = (
+    "\n"
+    "Routing/Navigation: Helps navigate between screens\n"
+    "  (e.g., Login → Home → Profile → Settings)\n"
+)
+
+_P2P_HELP = (
+    "\n"
+    "============================================================\n"
+    "P2P Library Selection:\n"
+    "============================================================\n"
+    "For long-distance play (over internet):\n"
+    "  → peerdart (WebRTC) - Works worldwide, recommended!\n"
+    "\n"
+    "For local play only (same WiFi/Bluetooth):\n"
+    "  → flutter_nearby_connections - Local network only\n"
+    "\n"
+    "For advanced low-latency games:\n"
+    "  → ENet Dart - Requires server setup\n"
+    "============================================================\n"
+)
+
+_PEERDART_NOTE = (
+    "\n"
+    "⚠️  Note: peerdart (WebRTC) may need a signaling server\n"
+    "   for initial connection setup. You can use free services\n"
+    "   like PeerJS cloud or set up your own simple server.\n"
+    "   The generated code includes basic P2P setup.\n"
+)
+
+
+# Yes/no prompt formats, picked by the default answer
+_YN_PROMPT_Y = "%s (Y/n): "
+_YN_PROMPT_N = "%s (y/N): "
+
+# Accepted yes/no answers; the common spellings match without normalizing
+_YES = frozenset(("y", "yes", "Y", "YES", "Yes"))
+_NO = frozenset(("n", "no", "N", "NO", "No"))
+
+# Yes/no feature questions as (preference key, prompt, default)
+_MACOS_FEATURES = (
+    ('has_menu_bar', "  Include menu bar?", True),
+    ('has_dock_icon', "  Show dock icon?", True),
+    ('has_notifications', "  Include notifications?", False),
+    ('has_file_access', "  Include file system access?", False),
+)
+
+_FLUTTER_FEATURES = (
+    ('has_localization', "  Include localization (i18n)?", False),
+    ('has_theme', "  Include theme management (dark/light mode)?", True),
+    ('has_analytics', "  Include analytics?", False),
+    ('has_crash_reporting', "  Include crash reporting?", False),
+)
+
+_TRANSACTIONAL_FEATURES = (
+    ('has_payments', "  Include payment integration?", False),
+    ('has_notifications', "  Include push notifications?", True),
+    ('has_offline_mode', "  Support offline mode?", True),
+)
+
+# Menu choices as (label shown, value stored) pairs, so answers need no
+# normalization after they are picked
+_PLATFORM_CHOICES = (
+    ("Flutter (Cross-platform)", "flutter (cross-platform)"),
+    ("macOS (Native Swift/SwiftUI)", "macos (native swift/swiftui)"),
+)
+
+_MACOS_CATEGORY_CHOICES = (
+    ("Desktop App", "desktop app"),
+    ("Menu Bar App", "menu bar app"),
+    ("Command Line Tool", "command line tool"),
+)
+
+_UI_FRAMEWORK_CHOICES = (
+    ("SwiftUI", "swiftui"),
+    ("AppKit", "appkit"),
+)
+
+_MACOS_AUTH_CHOICES = (
+    ("Keychain", "keychain"),
+    ("OAuth", "oauth"),
+    ("Custom", "custom"),
+)
+
+_MACOS_DATABASE_CHOICES = (
+    ("Core Data", "core_data"),
+    ("SQLite", "sqlite"),
+    ("Realm", "realm"),
+    ("None", "none"),
+)
+
+_FLUTTER_CATEGORY_CHOICES = (
+    ("Game", "game"),
+    ("Transactional App", "transactional app"),
+)
+
+_FLUTTER_AUTH_CHOICES = (
+    ("Firebase Auth", "firebase_auth"),
+    ("Custom Auth (REST API)", "custom_auth_(rest_api)"),
+    ("Local Auth (Biometric)", "local_auth_(biometric)"),
+)
+
+_FLUTTER_DATABASE_CHOICES = (
+    ("Firebase Firestore", "firebase_firestore"),
+    ("SQLite", "sqlite"),
+    ("REST API (No local DB)", "rest_api_(no_local_db)"),
+    ("None", "none"),
+)
+
+_ORIENTATION_CHOICES = (
+    ("Portrait only", "portrait"),
+    ("Landscape only", "landscape"),
+    ("Both (rotatable)", "both"),
+)
+
+_STATE_MGMT_CHOICES = (
+    ("Provider (Recommended for beginners)", "provider"),
+    ("Riverpod (Modern & type-safe)", "riverpod"),
+    ("Bloc (Pattern-based)", "bloc"),
+    ("GetX (All-in-one)", "getx"),
+    ("Redux (Predictable)", "redux"),
+)
+
+# Game engines are stored as shown; consumers lowercase them
+_GAME_ENGINE_CHOICES = (
+    ("Flame", "Flame"),
+    ("Unity (via flutter_unity_widget)", "Unity (via flutter_unity_widget)"),
+    ("Custom Canvas", "Custom Canvas"),
+)
+
+_MULTIPLAYER_CHOICES = (
+    ("Peer-to-Peer (P2P) - No server needed", "p2p"),
+    ("Online (requires server)", "online"),
+)
+
+_P2P_CHOICES = (
+    ("peerdart (WebRTC - Works over internet, recommended)", "peerdart"),
+    ("flutter_nearby_connections (Local WiFi/Bluetooth only)", "flutter_nearby_connections"),
+    ("ENet Dart (UDP - Advanced, needs server)", "enet_dart"),
+)
+
+# Question flows, run once the platform and app category are known. Each
+# step is (condition, kind, key, *args); ``condition`` is None or a
+# (key, value) pair an earlier answer must match. Kinds:
+#   'help'   write args[0]
+#   'yesno'  ask args (prompt, default) and store the answer under key
+#   'choice' ask args (question, choices, default) and store under key
+#   'table'  ask each (key, prompt, default) row of the feature table args[0]
+#   'set'    store args[0] under key
+_MACOS_FLOW = (
+    (None, 'choice', 'ui_framework', "Which UI framework?", _UI_FRAMEWORK_CHOICES, 0),
+    (None, 'yesno', 'has_auth', "Does your app require authentication?", False),
+    (None, 'set', 'auth_provider', None),
+    (('has_auth', True), 'choice', 'auth_provider',
+     "Which authentication method?", _MACOS_AUTH_CHOICES, 0),
+    (None, 'choice', 'database', "Which database would you like to use?", _MACOS_DATABASE_CHOICES, 0),
+    (None, 'help', None, "\nAdditional features:\n"),
+    (None, 'table', None, _MACOS_FEATURES),
+    (None, 'set', 'app_type', 'macos'),
+)
+
+_FLUTTER_COMMON_FLOW = (
+    (None, 'yesno', 'has_auth', "Does your app require authentication?", True),
+    (None, 'set', 'auth_provider', None),
+    (('has_auth', True), 'choice', 'auth_provider',
+     "Which authentication method would you like to use?", _FLUTTER_AUTH_CHOICES, 0),
+    (None, 'choice', 'database', "Which database would you like to use?", _FLUTTER_DATABASE_CHOICES, 0),
+    (None, 'help', None, _ORIENTATION_HELP),
+    (None, 'choice', 'orientation', "Which screen orientation do you want?", _ORIENTATION_CHOICES, 0),
+    (None, 'help', None, _STATE_MGMT_HELP),
+    (None, 'choice', 'state_management',
+     "Which state management solution would you like to use?", _STATE_MGMT_CHOICES, 0),
+    (None, 'help', None, "\nAdditional features:\n"),
+)
+
+# Asked by every Flutter flow right after its routing help text
+_FLUTTER_FEATURES_FLOW = (
+    (None, 'yesno', 'has_routing', "  Use routing/navigation?", True),
+    (None, 'table', None, _FLUTTER_FEATURES),
+)
+
+_FLUTTER_FLOWS = {
+    'game': _FLUTTER_COMMON_FLOW + (
+        (None, 'help', None, _GAME_ROUTING_HELP),
+    ) + _FLUTTER_FEATURES_FLOW + (
+        (None, 'choice', 'game_engine', "Which game engine/framework?", _GAME_ENGINE_CHOICES, 0),
+        (None, 'yesno', 'has_multiplayer', "  Support multiplayer?", False),
+        (('has_multiplayer', True), 'choice', 'multiplayer_type',
+         "What type of multiplayer?", _MULTIPLAYER_CHOICES, 0),
+        (('multiplayer_type', 'p2p'), 'help', None, _P2P_HELP),
+        (('multiplayer_type', 'p2p'), 'choice', 'p2p_library',
+         "Which P2P library? (Choose peerdart for long-distance)", _P2P_CHOICES, 0),
+        (('p2p_library', 'peerdart'), 'help', None, _PEERDART_NOTE),
+        (('has_multiplayer', False), 'set', 'multiplayer_type', None),
+        (('has_multiplayer', False), 'set', 'p2p_library', None),
+        (None, 'set', 'app_type', 'flutter'),
+    ),
+    'transactional app': _FLUTTER_COMMON_FLOW + (
+        (None, 'help', None, _ROUTING_HELP),
+    ) + _FLUTTER_FEATURES_FLOW + (
+        (None, 'table', None, _TRANSACTIONAL_FEATURES),
+        (None, 'set', 'app_type', 'flutter'),
+    ),
+}
+
+
+def _fast_input(prompt: str = '') -> str:
+    """Read one line like input(), without its per-call overhead.
+    
+    Interactive terminals keep the builtin so readline editing works; piped
+    input skips the empty flushes and reads the line directly.
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    
+    if prompt:
+        sys.stdout.write(prompt)
+    # stdout may be block-buffered while collecting; show everything first
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
 
 class QuestionHandler:
     """Handles interactive questions for template generation."""
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[Path] = None, replay: bool = False,
+                 answers: Optional[Iterable[str]] = None):
         self.preferences = {}
+        self.cache_path = Path(cache_path) if cache_path else _DEFAULT_CACHE_PATH
+        self.replay = replay
+        self._answers = deque(answers or ())
+    
+    def _input(self, prompt: str) -> str:
+        """Return the next pre-baked answer, or read one from the user."""
+        if self._answers:
+            answer = self._answers.popleft()
+            sys.stdout.write(f"{prompt}{answer}\n")
+            return answer
+        return _fast_input(prompt)
+    
+    @staticmethod
+    def _cache_key(platform: str, app_category: str) -> str:
+        """Key cached answers by the platform and app category."""
+        return hashlib.sha1(f"{platform}\0{app_category}".encode('utf-8')).hexdigest()
+    
+    def _read_cache(self) -> dict:
+        """Load the answer cache, treating a missing or corrupt file as empty."""
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    @staticmethod
+    def _fits_flow(flow: tuple, answers: Dict[str, Any]) -> bool:
+        """Check that ``answers`` holds a well-typed answer for every step of
+        ``flow`` that _run_flow() would have asked."""
+        for condition, kind, key, *args in flow:
+            if condition is not None and answers.get(condition[0]) != condition[1]:
+                continue
+            if kind == 'yesno':
+                if not isinstance(answers.get(key), bool):
+                    return False
+            elif kind == 'choice':
+                if answers.get(key) not in {value for _, value in args[1]}:
+                    return False
+            elif kind == 'table':
+                if not all(isinstance(answers.get(name), bool) for name, _, _ in args[0]):
+                    return False
+            elif kind == 'set':
+                if key not in answers:
+                    return False
+        return True
+    
+    def _replay_cached(self, answered: Dict[str, Any], flow: tuple) -> Optional[dict]:
+        """Complete ``answered`` from the cache, if an entry matches.
+        
+        Returns None when nothing usable is cached, meaning the remaining
+        questions of ``flow`` must be asked; stale or hand-edited entries that
+        do not fit ``flow`` are ignored. Answers already given take precedence.
+        """
+        key = self._cache_key(answered['platform'], answered['app_category'])
+        cached = self._read_cache().get(key)
+        if not isinstance(cached, dict):
+            return None
+        replayed = {**cached, **answered}
+        return replayed if self._fits_flow(flow, replayed) else None
+    
+    def _store_cache(self):
+        """Save the collected preferences for later replays; best effort."""
+        cache = self._read_cache()
+        key = self._cache_key(self.preferences['platform'], self.preferences['app_category'])
+        cache[key] = self.preferences
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+        except OSError:
+            pass
     
     def _ask_yes_no(self, question: str, default: bool = True) -> bool:
         """Ask a yes/no question and return boolean."""
-        default_str = "Y/n" if default else "y/N"
-        response = input(f"{question} ({default_str}): ").strip().lower()
+        response = self._input((_YN_PROMPT_Y if default else _YN_PROMPT_N) % question)
         
         if not response:
             return default
+        if response in _YES:
+            return True
+        if response in _NO:
+            return False
         
-        return response in ['y', 'yes']
+        # Anything else is normalized; unrecognized answers mean "no"
+        response = response.strip().lower()
+        if not response:
+            return default
+        return response in _YES
     
-    def _ask_choice(self, question: str, choices: list, default: int = 0) -> str:
-        """Ask user to choose from a list of options."""
-        print(f"\n{question}")
-        for i, choice in enumerate(choices, 1):
+    def _ask_choice(self, question: str, choices: tuple, default: int = 0) -> Any:
+        """Ask user to choose from (label, value) options; return the value."""
+        lines = [f"\n{question}"]
+        for i, (label, _) in enumerate(choices, 1):
             marker = "→" if i == default + 1 else " "
-            print(f"  {marker} {i}. {choice}")
+            lines.append(f"  {marker} {i}. {label}")
+        lines.append('')
+        sys.stdout.write("\n".join(lines))
         
         while True:
             try:
-                response = input(f"\nSelect option (1-{len(choices)}, default: {default + 1}): ").strip()
+                response = self._input(f"\nSelect option (1-{len(choices)}, default: {default + 1}): ").strip()
                 
                 if not response:
-                    return choices[default]
+                    return choices[default][1]
                 
                 choice_num = int(response)
                 if 1 <= choice_num <= len(choices):
-                    return choices[choice_num - 1]
+                    return choices[choice_num - 1][1]
                 else:
                     print(f"Please enter a number between 1 and {len(choices)}")
             except ValueError:
@@ -43,84 +424,83 @@ class QuestionHandler:
     
     def collect_preferences(self) -> dict:
         """Collect all user preferences through interactive questions."""
+        # Block-buffer stdout while asking so help text is written in large
+        # chunks; every read flushes it before blocking on the user
+        reconfigure = getattr(sys.stdout, 'reconfigure', None)
+        if reconfigure is None:
+            return self._collect_preferences()
+        
+        line_buffering = sys.stdout.line_buffering
+        write_through = sys.stdout.write_through
+        reconfigure(line_buffering=False, write_through=False)
+        try:
+            return self._collect_preferences()
+        finally:
+            reconfigure(line_buffering=line_buffering, write_through=write_through)
+    
+    def _collect_preferences(self) -> dict:
+        """Ask the platform question, then the platform-specific ones."""
         # First ask for platform/framework
         platform = self._ask_choice(
             "What platform/framework are you building for?",
-            ["Flutter (Cross-platform)", "macOS (Native Swift/SwiftUI)"],
+            _PLATFORM_CHOICES,
             default=0
         )
-        self.preferences['platform'] = platform.lower()
         
-        if 'macos' in platform.lower():
+        if 'macos' in platform:
             # macOS-specific questions
-            return self._collect_macos_preferences()
+            self.preferences = self._collect_macos_preferences(platform)
         else:
             # Flutter-specific questions
-            return self._collect_flutter_preferences()
+            self.preferences = self._collect_flutter_preferences(platform)
+        
+        # The cache is only touched when the caller opted into it
+        if self.replay:
+            self._store_cache()
+        return self.preferences
+    
+    def _run_flow(self, flow: tuple, answers: Dict[str, Any]) -> dict:
+        """Ask every step of ``flow`` whose condition holds, filling ``answers``."""
+        for condition, kind, key, *args in flow:
+            if condition is not None and answers.get(condition[0]) != condition[1]:
+                continue
+            if kind == 'help':
+                sys.stdout.write(args[0])
+            elif kind == 'yesno':
+                answers[key] = self._ask_yes_no(*args)
+            elif kind == 'choice':
+                answers[key] = self._ask_choice(*args)
+            elif kind == 'table':
+                for name, prompt, default in args[0]:
+                    answers[name] = self._ask_yes_no(prompt, default=default)
+            else:
+                answers[key] = args[0]
+        return answers
     
-    def _collect_macos_preferences(self) -> dict:
+    def _collect_macos_preferences(self, platform: str) -> dict:
         """Collect preferences for macOS native apps."""
         print("Let's configure your macOS app template...\n")
         
         # App type
         app_category = self._ask_choice(
             "What type of app are you building?",
-            ["Desktop App", "Menu Bar App", "Command Line Tool"],
-            default=0
-        )
-        self.preferences['app_category'] = app_category.lower()
-        
-        # UI Framework
-        ui_framework = self._ask_choice(
-            "Which UI framework?",
-            ["SwiftUI", "AppKit"],
+            _MACOS_CATEGORY_CHOICES,
             default=0
         )
-        self.preferences['ui_framework'] = ui_framework.lower()
-        
-        # Authentication
-        has_auth = self._ask_yes_no("Does your app require authentication?", default=False)
-        self.preferences['has_auth'] = has_auth
-        
-        if has_auth:
-            auth_provider = self._ask_choice(
-                "Which authentication method?",
-                ["Keychain", "OAuth", "Custom"],
-                default=0
-            )
-            self.preferences['auth_provider'] = auth_provider.lower()
-        else:
-            self.preferences['auth_provider'] = None
+        answers = {'platform': platform, 'app_category': app_category}
+        if self.replay:
+            cached = self._replay_cached(answers, _MACOS_FLOW)
+            if cached is not None:
+                return cached
         
-        # Database
-        database_choice = self._ask_choice(
-            "Which database would you like to use?",
-            ["Core Data", "SQLite", "Realm", "None"],
-            default=0
-        )
-        self.preferences['database'] = database_choice.lower().replace(' ', '_')
-        
-        # Additional features
-        print("\nAdditional features:")
-        self.preferences['has_menu_bar'] = self._ask_yes_no("  Include menu bar?", default=True)
-        self.preferences['has_dock_icon'] = self._ask_yes_no("  Show dock icon?", default=True)
-        self.preferences['has_notifications'] = self._ask_yes_no("  Include notifications?", default=False)
-        self.preferences['has_file_access'] = self._ask_yes_no("  Include file system access?", default=False)
-        
-        self.preferences['app_type'] = 'macos'
-        return self.preferences
+        return self._run_flow(_MACOS_FLOW, answers)
     
-    def _collect_flutter_preferences(self) -> dict:
+    def _collect_flutter_preferences(self, platform: str) -> dict:
         """Collect preferences for Flutter apps."""
         print("Let's configure your Flutter app template...\n")
         
         # Platform selection
-        print("\n" + "=" * 60)
-        print("Platform Selection:")
-        print("=" * 60)
-        print("Which platforms do you want to support?")
-        print("(You can select multiple platforms)")
-        print("=" * 60)
+        sys.stdout.write(_PLATFORM_HELP)
         
         platforms = {
             'android': self._ask_yes_no("  Android?", default=True),
@@ -132,173 +512,29 @@ class QuestionHandler:
         }
         
         # Filter to only selected platforms
-        selected_platforms = [platform for platform, selected in platforms.items() if selected]
+        selected_platforms = [name for name, selected in platforms.items() if selected]
         if not selected_platforms:
             print("  ⚠️  No platforms selected. Defaulting to Android and iOS.")
             selected_platforms = ['android', 'ios']
         
-        self.preferences['platforms'] = selected_platforms
         print(f"\n✓ Selected platforms: {', '.join([p.upper() for p in selected_platforms])}")
         
         # App type (game or transactional)
         app_category = self._ask_choice(
             "What type of app are you building?",
-            ["Game", "Transactional App"],
+            _FLUTTER_CATEGORY_CHOICES,
             default=1
         )
-        self.preferences['app_category'] = app_category.lower()
-        
-        # Authentication
-        has_auth = self._ask_yes_no("Does your app require authentication?", default=True)
-        self.preferences['has_auth'] = has_auth
-        
-        auth_provider = None
-        if has_auth:
-            auth_provider = self._ask_choice(
-                "Which authentication method would you like to use?",
-                ["Firebase Auth", "Custom Auth (REST API)", "Local Auth (Biometric)"],
-                default=0
-            )
-        self.preferences['auth_provider'] = auth_provider.lower().replace(' ', '_') if auth_provider else None
-        
-        # Database
-        database_choice = self._ask_choice(
-            "Which database would you like to use?",
-            ["Firebase Firestore", "SQLite", "REST API (No local DB)", "None"],
-            default=0
-        )
-        self.preferences['database'] = database_choice.lower().replace(' ', '_')
-        
-        # Screen orientation
-        print("\n" + "=" * 60)
-        print("Screen Orientation:")
-        print("=" * 60)
-        print("Portrait mode: Phone held vertically (taller than wide)")
-        print("  • Best for: Reading, scrolling, forms, social media")
-        print("  • Example: Most apps like Instagram, Twitter, WhatsApp")
-        print("\nLandscape mode: Phone held horizontally (wider than tall)")
-        print("  • Best for: Games, videos, spreadsheets, presentations")
-        print("  • Example: Video players, racing games, calculators")
-        print("\nBoth: App can rotate between portrait and landscape")
-        print("  • Best for: Apps that benefit from both orientations")
-        print("=" * 60)
-        orientation_choice = self._ask_choice(
-            "Which screen orientation do you want?",
-            ["Portrait only", "Landscape only", "Both (rotatable)"],
-            default=0
-        )
-        # Map choice to orientation preference
-        if 'portrait' in orientation_choice.lower():
-            self.preferences['orientation'] = 'portrait'
-        elif 'landscape' in orientation_choice.lower():
-            self.preferences['orientation'] = 'landscape'
-        else:
-            self.preferences['orientation'] = 'both'
-        
-        # State management
-        print("\n" + "=" * 60)
-        print("State Management Explanation:")
-        print("=" * 60)
-        print("State management helps you manage data that changes in your app.")
-        print("For example: user login status, shopping cart items, game scores, etc.")
-        print("\nQuick guide:")
-        print("  • Provider: Simple, recommended for beginners (official Flutter)")
-        print("  • Riverpod: Modern, type-safe, great for larger apps")
-        print("  • Bloc: Pattern-based, good for complex business logic")
-        print("  • GetX: All-in-one solution, very popular")
-        print("  • Redux: Predictable state container, from web development")
-        print("=" * 60)
-        state_management = self._ask_choice(
-            "Which state management solution would you like to use?",
-            ["Provider (Recommended for beginners)", "Riverpod (Modern & type-safe)", "Bloc (Pattern-based)", "GetX (All-in-one)", "Redux (Predictable)"],
-            default=0
-        )
-        # Extract the actual name (remove description in parentheses)
-        state_mgmt_name = state_management.split('(')[0].strip().lower()
-        self.preferences['state_management'] = state_mgmt_name
-        
-        # Additional features
-        print("\nAdditional features:")
-        
-        # Context-aware routing explanation
-        if self.preferences['app_category'] == 'game':
-            print("\n" + "-" * 60)
-            print("Routing/Navigation for Games:")
-            print("-" * 60)
-            print("Routing helps you navigate between different screens:")
-            print("  ✓ Main Menu → Game Screen → Game Over → Settings")
-            print("  ✓ Level Selection → Game → Pause Menu")
-            print("  ✓ Leaderboard, Shop, Profile screens")
-            print("\nWithout routing: You'd manage all screens manually")
-            print("With routing: Clean navigation between screens")
-            print("\nSimple single-screen games might not need routing.")
-            print("Games with menus, levels, or multiple screens benefit from it.")
-            print("-" * 60)
-            self.preferences['has_routing'] = self._ask_yes_no("  Use routing/navigation?", default=True)
-        else:
-            print("\nRouting/Navigation: Helps navigate between screens")
-            print("  (e.g., Login → Home → Profile → Settings)")
-            self.preferences['has_routing'] = self._ask_yes_no("  Use routing/navigation?", default=True)
-        self.preferences['has_localization'] = self._ask_yes_no("  Include localization (i18n)?", default=False)
-        self.preferences['has_theme'] = self._ask_yes_no("  Include theme management (dark/light mode)?", default=True)
-        self.preferences['has_analytics'] = self._ask_yes_no("  Include analytics?", default=False)
-        self.preferences['has_crash_reporting'] = self._ask_yes_no("  Include crash reporting?", default=False)
-        
-        # Game-specific questions
-        if self.preferences['app_category'] == 'game':
-            self.preferences['game_engine'] = self._ask_choice(
-                "Which game engine/framework?",
-                ["Flame", "Unity (via flutter_unity_widget)", "Custom Canvas"],
-                default=0
-            )
-            self.preferences['has_multiplayer'] = self._ask_yes_no("  Support multiplayer?", default=False)
-            
-            if self.preferences['has_multiplayer']:
-                multiplayer_type = self._ask_choice(
-                    "What type of multiplayer?",
-                    ["Peer-to-Peer (P2P) - No server needed", "Online (requires server)"],
-                    default=0
-                )
-                self.preferences['multiplayer_type'] = 'p2p' if 'peer' in multiplayer_type.lower() else 'online'
-                
-                if self.preferences['multiplayer_type'] == 'p2p':
-                    print("\n" + "=" * 60)
-                    print("P2P Library Selection:")
-                    print("=" * 60)
-                    print("For long-distance play (over internet):")
-                    print("  → peerdart (WebRTC) - Works worldwide, recommended!")
-                    print("\nFor local play only (same WiFi/Bluetooth):")
-                    print("  → flutter_nearby_connections - Local network only")
-                    print("\nFor advanced low-latency games:")
-                    print("  → ENet Dart - Requires server setup")
-                    print("=" * 60)
-                    p2p_library = self._ask_choice(
-                        "Which P2P library? (Choose peerdart for long-distance)",
-                        ["peerdart (WebRTC - Works over internet, recommended)", "flutter_nearby_connections (Local WiFi/Bluetooth only)", "ENet Dart (UDP - Advanced, needs server)"],
-                        default=0
-                    )
-                    # Extract library name
-                    lib_name = p2p_library.lower().split('(')[0].strip().replace(' ', '_')
-                    self.preferences['p2p_library'] = lib_name
-                    
-                    # Add note about signaling for peerdart
-                    if lib_name == 'peerdart':
-                        print("\n" + "⚠️  Note: peerdart (WebRTC) may need a signaling server")
-                        print("   for initial connection setup. You can use free services")
-                        print("   like PeerJS cloud or set up your own simple server.")
-                        print("   The generated code includes basic P2P setup.")
-            else:
-                self.preferences['multiplayer_type'] = None
-                self.preferences['p2p_library'] = None
-        
-        # Transactional app-specific questions
-        if self.preferences['app_category'] == 'transactional app':
-            self.preferences['has_payments'] = self._ask_yes_no("  Include payment integration?", default=False)
-            self.preferences['has_notifications'] = self._ask_yes_no("  Include push notifications?", default=True)
-            self.preferences['has_offline_mode'] = self._ask_yes_no("  Support offline mode?", default=True)
-        
-        # App type identifier for generator
-        self.preferences['app_type'] = 'flutter'
+        answers = {
+            'platform': platform,
+            'platforms': selected_platforms,
+            'app_category': app_category,
+        }
+        # The rest of the interview is fixed by the app category
+        flow = _FLUTTER_FLOWS[app_category]
+        if self.replay:
+            cached = self._replay_cached(answers, flow)
+            if cached is not None:
+                return cached
         
-        return self.preferences
-
+        return self._run_flow(flow, answers)